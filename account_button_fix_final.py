@@ -5,31 +5,61 @@ menu without relying on database access.
 
 import logging
 import sqlite3
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Static account menu keyboard, built once at import time
+_ACCOUNT_KEYBOARD = {
+    "inline_keyboard": [
+        [{"text": "💼 Connect Wallet", "callback_data": "account_wallet"}],
+        [
+            {"text": "🔴 High-Risk Profile", "callback_data": "account_profile_high-risk"},
+            {"text": "🟢 Stable Profile", "callback_data": "account_profile_stable"}
+        ],
+        [
+            {"text": "🔔 Subscribe", "callback_data": "account_subscribe"},
+            {"text": "🔕 Unsubscribe", "callback_data": "account_unsubscribe"}
+        ],
+        [{"text": "❓ Help", "callback_data": "account_help"}],
+        [{"text": "🏠 Back to Main Menu", "callback_data": "back_to_main"}]
+    ]
+}
+
 def get_account_menu_keyboard():
     """
     Get the account menu inline keyboard with proper callback data.
+    
+    The same keyboard object is returned on every call; callers must not mutate it.
+    """
+    return _ACCOUNT_KEYBOARD
+
+@lru_cache(maxsize=1024)
+def _account_message(risk_profile: Optional[str], wallet_short: Optional[str], subscribed: bool) -> str:
+    """
+    Build the account summary text; memoized since few distinct combinations occur.
+    
+    Args:
+        risk_profile: The user's risk profile, or None if unset
+        wallet_short: Truncated wallet address, or None if not connected
+        subscribed: Whether the user receives daily updates
+        
+    Returns:
+        Markdown message for the account menu
     """
-    return {
-        "inline_keyboard": [
-            [{"text": "💼 Connect Wallet", "callback_data": "account_wallet"}],
-            [
-                {"text": "🔴 High-Risk Profile", "callback_data": "account_profile_high-risk"},
-                {"text": "🟢 Stable Profile", "callback_data": "account_profile_stable"}
-            ],
-            [
-                {"text": "🔔 Subscribe", "callback_data": "account_subscribe"},
-                {"text": "🔕 Unsubscribe", "callback_data": "account_unsubscribe"}
-            ],
-            [{"text": "❓ Help", "callback_data": "account_help"}],
-            [{"text": "🏠 Back to Main Menu", "callback_data": "back_to_main"}]
-        ]
-    }
+    wallet_status = f"✅ Connected ({wallet_short})" if wallet_short else "❌ Not Connected"
+    profile_type = risk_profile.capitalize() if risk_profile else "Not Set"
+    subscription_status = "✅ Subscribed" if subscribed else "❌ Not Subscribed"
+    
+    return (
+        f"👤 *Your Account* 👤\n\n"
+        f"*Wallet:* {wallet_status}\n"
+        f"*Risk Profile:* {profile_type}\n"
+        f"*Daily Updates:* {subscription_status}\n\n"
+        f"Select an option below to manage your account:"
+    )
 
 def handle_account_button(user_id: int) -> Dict[str, Any]:
     """
@@ -45,31 +75,18 @@ def handle_account_button(user_id: int) -> Dict[str, Any]:
         # Try to get basic user info from database
         user_info = get_basic_user_info(user_id)
         
-        # Create account details based on retrieved info
-        wallet_status = "❌ Not Connected"
-        profile_type = "Not Set"
-        subscription_status = "❌ Not Subscribed"
+        risk_profile = None
+        wallet_short = None
+        subscribed = False
         
         if user_info.get("success"):
+            risk_profile = user_info.get("risk_profile")
             wallet_address = user_info.get("wallet_address")
             if wallet_address:
-                wallet_status = f"✅ Connected ({wallet_address[:6]}...{wallet_address[-4:]})"
-            
-            risk_profile = user_info.get("risk_profile")
-            if risk_profile:
-                profile_type = risk_profile.capitalize()
-            
-            if user_info.get("subscribed"):
-                subscription_status = "✅ Subscribed"
+                wallet_short = f"{wallet_address[:6]}...{wallet_address[-4:]}"
+            subscribed = bool(user_info.get("subscribed"))
         
-        # Create message
-        message = (
-            f"👤 *Your Account* 👤\n\n"
-            f"*Wallet:* {wallet_status}\n"
-            f"*Risk Profile:* {profile_type}\n"
-            f"*Daily Updates:* {subscription_status}\n\n"
-            f"Select an option below to manage your account:"
-        )
+        message = _account_message(risk_profile, wallet_short, subscribed)
         
         # Get account menu keyboard
         reply_markup = get_account_menu_keyboard()
@@ -80,7 +97,7 @@ def handle_account_button(user_id: int) -> Dict[str, Any]:
             "reply_markup": reply_markup
         }
     except Exception as e:
-        logger.error(f"Error in handle_account_button: {e}")
+        logger.error("Error in handle_account_button: %s", e)
         
         # Return a simple fallback message with the menu
         return {
@@ -102,10 +119,9 @@ def get_basic_user_info(user_id: int) -> Dict[str, Any]:
     try:
         # Use a direct connection to the database
         conn = sqlite3.connect("filot_bot.db")
-        cursor = conn.cursor()
         
         # Make sure the table exists
-        cursor.execute('''
+        conn.execute('''
         CREATE TABLE IF NOT EXISTS users (
             id INTEGER PRIMARY KEY,
             username TEXT,
@@ -122,43 +138,27 @@ def get_basic_user_info(user_id: int) -> Dict[str, Any]:
         )
         ''')
         
-        # Check if user exists
-        cursor.execute("SELECT id, risk_profile, subscribed, wallet_address FROM users WHERE id = ?", (user_id,))
-        user_record = cursor.fetchone()
-        
-        # Close connection
+        # Create the user if missing, then read it back on the same connection
+        conn.execute(
+            "INSERT OR IGNORE INTO users (id, username) VALUES (?, ?)",
+            (user_id, f"user_{user_id}")
+        )
+        user_id, risk_profile, subscribed, wallet_address = conn.execute(
+            "SELECT id, risk_profile, subscribed, wallet_address FROM users WHERE id = ?",
+            (user_id,)
+        ).fetchone()
+        conn.commit()
         conn.close()
         
-        if user_record:
-            # User exists, return the info
-            user_id, risk_profile, subscribed, wallet_address = user_record
-            return {
-                "success": True,
-                "user_id": user_id,
-                "risk_profile": risk_profile,
-                "subscribed": subscribed == 1,
-                "wallet_address": wallet_address
-            }
-        else:
-            # User doesn't exist, create one
-            conn = sqlite3.connect("filot_bot.db")
-            cursor = conn.cursor()
-            cursor.execute(
-                "INSERT INTO users (id, username) VALUES (?, ?)",
-                (user_id, f"user_{user_id}")
-            )
-            conn.commit()
-            conn.close()
-            
-            return {
-                "success": True,
-                "user_id": user_id,
-                "risk_profile": "stable",
-                "subscribed": False,
-                "wallet_address": None
-            }
+        return {
+            "success": True,
+            "user_id": user_id,
+            "risk_profile": risk_profile,
+            "subscribed": subscribed == 1,
+            "wallet_address": wallet_address
+        }
     except Exception as e:
-        logger.error(f"Database error in get_basic_user_info: {e}")
+        logger.error("Database error in get_basic_user_info: %s", e)
         return {
             "success": False,
             "error": str(e)
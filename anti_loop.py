@@ -6,12 +6,14 @@ Anti-loop protection mechanism for the Telegram bot.
 This module provides global locking to completely prevent message loops.
 """
 
+import math
 import time
+import heapq
 import hashlib
 import threading
 import logging
-from typing import Dict, Set, Tuple, Optional, Any
-from collections import defaultdict
+from typing import Dict, List, Tuple, Optional, Any
+from collections import defaultdict, deque, OrderedDict
 
 # Configure logging
 logging.basicConfig(
@@ -24,8 +26,9 @@ logger = logging.getLogger("anti_loop")
 _lock = threading.RLock()
 
 # Global protection mechanism
-_processed_messages: Set[str] = set()
+_processed_messages: "OrderedDict[str, None]" = OrderedDict()  # insertion-ordered LRU
 _recent_messages: Dict[str, float] = {}
+_recent_expiry: List[Tuple[float, str]] = []  # min-heap of (timestamp, content_key)
 _user_locks: Dict[int, bool] = defaultdict(bool)
 _chat_locks: Dict[int, Dict[str, float]] = defaultdict(dict)
 _callback_locks: Dict[str, float] = {}
@@ -35,6 +38,65 @@ MAX_TRACKING_SIZE = 1000
 MAX_LOCK_DURATION = 2.0  # seconds - reduced from 5.0 to be less aggressive for buttons
 BUTTON_COOLDOWN = 0.5  # seconds - very short cooldown for buttons specifically
 
+class SlidingBloomFilter:
+    """
+    Time-bucketed Bloom filter answering "was this key seen in the last window?".
+    
+    Keys are added to the newest segment; membership is checked across all live
+    segments, and whole segments are dropped as they age out, so no per-key
+    timestamps or sweeps are needed. A key stays visible for at least `window`
+    seconds (and at most one extra segment). False positives occur at roughly
+    `error_rate` while each segment holds no more than `capacity` keys.
+    
+    Segments are shared between threads, so every access holds the module _lock.
+    """
+    
+    def __init__(self, capacity: int = 1000, error_rate: float = 1e-6,
+                 window: float = 10.0, segment_seconds: float = 2.0):
+        self._num_bits = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self._num_hashes = max(1, round(self._num_bits / capacity * math.log(2)))
+        self._segment_seconds = segment_seconds
+        num_segments = math.ceil(window / segment_seconds) + 1
+        self._segments = deque(
+            (bytearray((self._num_bits + 7) // 8) for _ in range(num_segments)),
+            maxlen=num_segments
+        )
+        self._epoch = int(time.monotonic() // segment_seconds)
+    
+    def _rotate(self) -> None:
+        """Drop the segments that have aged out since the last call."""
+        with _lock:
+            epoch = int(time.monotonic() // self._segment_seconds)
+            elapsed = min(epoch - self._epoch, len(self._segments))
+            for _ in range(elapsed):
+                self._segments.append(bytearray((self._num_bits + 7) // 8))
+            self._epoch = epoch
+    
+    def _positions(self, key: str) -> List[int]:
+        """Bit positions for a key, via double hashing of one blake2b digest."""
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self._num_bits for i in range(self._num_hashes)]
+    
+    def add(self, key: str) -> None:
+        """Record a key in the current segment."""
+        positions = self._positions(key)
+        with _lock:
+            self._rotate()
+            segment = self._segments[-1]
+            for pos in positions:
+                segment[pos >> 3] |= 1 << (pos & 7)
+    
+    def __contains__(self, key: str) -> bool:
+        positions = self._positions(key)
+        with _lock:
+            self._rotate()
+            return any(
+                all(segment[pos >> 3] & (1 << (pos & 7)) for pos in positions)
+                for segment in self._segments
+            )
+
 def is_message_looping(chat_id: int, message_text: Optional[str] = None, 
                        callback_id: Optional[str] = None) -> bool:
     """
@@ -59,7 +121,7 @@ def is_message_looping(chat_id: int, message_text: Optional[str] = None,
         # 2. Check message content if provided
         if message_text:
             # Create a hash of the message content
-            msg_hash = hashlib.md5(message_text.encode()).hexdigest()[:12]
+            msg_hash = hashlib.blake2b(message_text.encode(), digest_size=6).hexdigest()
             content_key = f"{chat_id}_{msg_hash}"
             
             # Check if this is a button-related message (callbacks or menu items)
@@ -96,6 +158,7 @@ def is_message_looping(chat_id: int, message_text: Optional[str] = None,
             
             # Update the recent messages
             _recent_messages[content_key] = now
+            heapq.heappush(_recent_expiry, (now, content_key))
             
             # Clean up old entries
             _cleanup_tracking()
@@ -157,8 +220,10 @@ def is_message_looping(chat_id: int, message_text: Optional[str] = None,
                 logger.warning(f"Duplicate callback detected: {callback_id}")
                 return True
                 
-            # Add to processed messages
-            _processed_messages.add(callback_key)
+            # Add to processed messages, evicting the oldest entry when full
+            _processed_messages[callback_key] = None
+            if len(_processed_messages) > MAX_TRACKING_SIZE:
+                _processed_messages.popitem(last=False)
             
             # Clean up old entries
             _cleanup_tracking()
@@ -193,18 +258,15 @@ def _release_lock(chat_id: int) -> None:
 
 def _cleanup_tracking() -> None:
     """Clean up tracking data to prevent memory leaks."""
-    global _processed_messages, _recent_messages
-    
     with _lock:
-        # Limit the size of processed_messages
-        if len(_processed_messages) > MAX_TRACKING_SIZE:
-            _processed_messages = set(list(_processed_messages)[-MAX_TRACKING_SIZE:])
-            
-        # Remove old recent messages
-        now = time.time()
-        old_keys = [k for k, v in _recent_messages.items() if now - v > 30.0]
-        for k in old_keys:
-            _recent_messages.pop(k, None)
+        # Remove old recent messages (processed messages are bounded on insert),
+        # stopping at the first entry that hasn't expired yet
+        cutoff = time.time() - 30.0
+        while _recent_expiry and _recent_expiry[0][0] < cutoff:
+            timestamp, content_key = heapq.heappop(_recent_expiry)
+            # Skip stale heap entries for keys that were refreshed since
+            if _recent_messages.get(content_key) == timestamp:
+                del _recent_messages[content_key]
 
 def reset_all_locks() -> None:
     """Reset all locks and tracking data."""
@@ -214,6 +276,7 @@ def reset_all_locks() -> None:
         _callback_locks.clear()
         _processed_messages.clear()
         _recent_messages.clear()
+        _recent_expiry.clear()
         logger.info("All anti-loop locks and tracking data have been reset")
 
 # ------------------ MONKEY PATCHING FUNCTIONS ------------------
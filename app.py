@@ -14,7 +14,7 @@ from flask_sqlalchemy import SQLAlchemy
 from dotenv import load_dotenv
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy import text
-from models import db, User, Pool, BotStatistics, UserQuery, UserActivityLog, ErrorLog, Post
+from models import db, User, Pool, BotStatistics, UserQuery, UserActivityLog, ErrorLog, Post, CompositeSignal
 
 # Load environment variables
 load_dotenv()
@@ -125,6 +125,9 @@ anti_idle_thread = start_anti_idle_thread()
 with app.app_context():
     try:
         db.create_all()
+        # create_all only adds indexes along with new tables
+        for index in CompositeSignal.__table__.indexes:
+            index.create(db.engine, checkfirst=True)
         logger.info("Database tables created successfully")
     except Exception as e:
         logger.error(f"Error creating database tables: {e}")
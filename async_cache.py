@@ -0,0 +1,72 @@
+"""
+Result caching for coroutine functions.
+
+functools.lru_cache cannot be used on ``async def`` functions: it stores the
+coroutine object, which can only be awaited once. async_ttl_cache stores the
+awaited result instead and expires it after a fixed time-to-live. Concurrent
+calls that miss the cache for the same arguments share a single in-flight
+call instead of each starting their own.
+"""
+
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+def async_ttl_cache(
+    ttl: float,
+    maxsize: int = 128,
+    cache_if: Optional[Callable[[Any], bool]] = None
+) -> Callable:
+    """
+    Cache the results of a coroutine function for ``ttl`` seconds.
+
+    Entries are keyed on the positional arguments (including ``self`` for
+    methods) and evicted least-recently-used once ``maxsize`` is reached.
+    While a call is in flight, other callers with the same arguments await
+    its result rather than repeating it.
+
+    Args:
+        ttl: Seconds a result stays valid
+        maxsize: Maximum number of cached results
+        cache_if: Optional predicate; results for which it returns False are
+            returned but not cached (e.g. error responses)
+
+    Returns:
+        Decorator for an ``async def`` function
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        cache: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        inflight: Dict[Tuple, "asyncio.Task[Any]"] = {}
+
+        def finish(args: Tuple, task: "asyncio.Task[Any]") -> None:
+            inflight.pop(args, None)
+            if task.cancelled() or task.exception() is not None:
+                return
+            result = task.result()
+            if cache_if is None or cache_if(result):
+                cache[args] = (time.monotonic(), result)
+                cache.move_to_end(args)
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+
+        @functools.wraps(func)
+        async def wrapper(*args):
+            entry = cache.get(args)
+            if entry is not None and time.monotonic() - entry[0] < ttl:
+                cache.move_to_end(args)
+                return entry[1]
+
+            task = inflight.get(args)
+            if task is None:
+                task = asyncio.ensure_future(func(*args))
+                inflight[args] = task
+                task.add_done_callback(functools.partial(finish, args))
+            # Shielded so one cancelled caller does not cancel the shared call
+            return await asyncio.shield(task)
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
@@ -11,6 +11,60 @@ from typing import Dict, Any, Optional
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Static keyboards, built once at import time
+_ACCOUNT_KEYBOARD = {
+    "inline_keyboard": [
+        [{"text": "💼 Connect Wallet", "callback_data": "account_wallet"}],
+        [
+            {"text": "🔴 High-Risk Profile", "callback_data": "account_profile_high-risk"},
+            {"text": "🟢 Stable Profile", "callback_data": "account_profile_stable"}
+        ],
+        [
+            {"text": "🔔 Subscribe", "callback_data": "account_subscribe"},
+            {"text": "🔕 Unsubscribe", "callback_data": "account_unsubscribe"}
+        ],
+        [
+            {"text": "❓ Help", "callback_data": "show_help"},
+            {"text": "📊 Status", "callback_data": "account_status"}
+        ],
+        [{"text": "🏠 Back to Main Menu", "callback_data": "back_to_main"}]
+    ]
+}
+
+_WALLET_KEYBOARD = {
+    "inline_keyboard": [
+        [{"text": "📝 Connect by Address", "callback_data": "wallet_connect_address"}],
+        [{"text": "📱 Connect with QR Code", "callback_data": "wallet_connect_qr"}],
+        [{"text": "👤 Back to Account", "callback_data": "menu_account"}]
+    ]
+}
+
+_BACK_TO_ACCOUNT_KEYBOARD = {
+    "inline_keyboard": [
+        [{"text": "👤 Back to Account", "callback_data": "menu_account"}]
+    ]
+}
+
+# Profile confirmation messages, built once at import time
+_PROFILE_MSGS = {
+    "high-risk": (
+        "🔴 *High-Risk Profile Selected* 🔴\n\n"
+        "You've set your risk preference to *High-Risk*.\n\n"
+        "You'll now receive investment opportunities with higher potential returns "
+        "but also higher volatility and risk exposure.\n\n"
+        "Remember that high returns come with increased risk of loss. "
+        "Only invest what you can afford to lose."
+    ),
+    "stable": (
+        "🟢 *Stable Profile Selected* 🟢\n\n"
+        "You've set your risk preference to *Stable*.\n\n"
+        "You'll now receive investment opportunities with moderate returns "
+        "and lower volatility and risk exposure.\n\n"
+        "This profile focuses on more established pools with proven track records "
+        "and lower impermanent loss risk."
+    ),
+}
+
 def handle_account_button(user_id: int) -> Dict[str, Any]:
     """
     Handle the Account button click with a direct implementation.
@@ -39,30 +93,10 @@ def handle_account_button(user_id: int) -> Dict[str, Any]:
             "Select an option below to manage your account:"
         )
         
-        # Create the account menu keyboard with all required buttons
-        reply_markup = {
-            "inline_keyboard": [
-                [{"text": "💼 Connect Wallet", "callback_data": "account_wallet"}],
-                [
-                    {"text": "🔴 High-Risk Profile", "callback_data": "account_profile_high-risk"},
-                    {"text": "🟢 Stable Profile", "callback_data": "account_profile_stable"}
-                ],
-                [
-                    {"text": "🔔 Subscribe", "callback_data": "account_subscribe"},
-                    {"text": "🔕 Unsubscribe", "callback_data": "account_unsubscribe"}
-                ],
-                [
-                    {"text": "❓ Help", "callback_data": "show_help"},
-                    {"text": "📊 Status", "callback_data": "account_status"}
-                ],
-                [{"text": "🏠 Back to Main Menu", "callback_data": "back_to_main"}]
-            ]
-        }
-        
         return {
             "success": True,
             "message": message,
-            "reply_markup": reply_markup
+            "reply_markup": _ACCOUNT_KEYBOARD
         }
     except Exception as e:
         logger.error(f"Error in handle_account_button: {e}")
@@ -70,7 +104,7 @@ def handle_account_button(user_id: int) -> Dict[str, Any]:
         return {
             "success": False,
             "message": "👤 *Account Management* 👤\n\nManage your FiLot account settings and preferences:",
-            "reply_markup": create_basic_menu()
+            "reply_markup": _ACCOUNT_KEYBOARD
         }
 
 def get_user_info(user_id: int) -> Dict[str, Any]:
@@ -141,26 +175,9 @@ def create_basic_menu() -> Dict[str, Any]:
     Create a basic account menu without any database access.
     
     Returns:
-        Dict with inline keyboard markup
+        Dict with inline keyboard markup (shared; callers must not mutate it)
     """
-    return {
-        "inline_keyboard": [
-            [{"text": "💼 Connect Wallet", "callback_data": "account_wallet"}],
-            [
-                {"text": "🔴 High-Risk Profile", "callback_data": "account_profile_high-risk"},
-                {"text": "🟢 Stable Profile", "callback_data": "account_profile_stable"}
-            ],
-            [
-                {"text": "🔔 Subscribe", "callback_data": "account_subscribe"},
-                {"text": "🔕 Unsubscribe", "callback_data": "account_unsubscribe"}
-            ],
-            [
-                {"text": "❓ Help", "callback_data": "show_help"},
-                {"text": "📊 Status", "callback_data": "account_status"}
-            ],
-            [{"text": "🏠 Back to Main Menu", "callback_data": "back_to_main"}]
-        ]
-    }
+    return _ACCOUNT_KEYBOARD
 
 def handle_wallet_button(user_id: int) -> Dict[str, Any]:
     """
@@ -179,18 +196,10 @@ def handle_wallet_button(user_id: int) -> Dict[str, Any]:
             "Choose how you want to connect your wallet:"
         )
         
-        reply_markup = {
-            "inline_keyboard": [
-                [{"text": "📝 Connect by Address", "callback_data": "wallet_connect_address"}],
-                [{"text": "📱 Connect with QR Code", "callback_data": "wallet_connect_qr"}],
-                [{"text": "👤 Back to Account", "callback_data": "menu_account"}]
-            ]
-        }
-        
         return {
             "success": True,
             "message": message,
-            "reply_markup": reply_markup
+            "reply_markup": _WALLET_KEYBOARD
         }
     except Exception as e:
         logger.error(f"Error in handle_wallet_button: {e}")
@@ -221,37 +230,13 @@ def handle_profile_button(user_id: int, profile_type: str) -> Dict[str, Any]:
         # Update the user's profile
         update_user_profile(user_id, profile_type)
         
-        # Create a message for the selected profile
-        if profile_type == "high-risk":
-            message = (
-                "🔴 *High-Risk Profile Selected* 🔴\n\n"
-                "You've set your risk preference to *High-Risk*.\n\n"
-                "You'll now receive investment opportunities with higher potential returns "
-                "but also higher volatility and risk exposure.\n\n"
-                "Remember that high returns come with increased risk of loss. "
-                "Only invest what you can afford to lose."
-            )
-        else:  # stable profile
-            message = (
-                "🟢 *Stable Profile Selected* 🟢\n\n"
-                "You've set your risk preference to *Stable*.\n\n"
-                "You'll now receive investment opportunities with moderate returns "
-                "and lower volatility and risk exposure.\n\n"
-                "This profile focuses on more established pools with proven track records "
-                "and lower impermanent loss risk."
-            )
-        
-        # Get back to account menu keyboard
-        reply_markup = {
-            "inline_keyboard": [
-                [{"text": "👤 Back to Account", "callback_data": "menu_account"}]
-            ]
-        }
+        # Pick the message for the selected profile
+        message = _PROFILE_MSGS.get(profile_type, _PROFILE_MSGS["stable"])
         
         return {
             "success": True,
             "message": message,
-            "reply_markup": reply_markup
+            "reply_markup": _BACK_TO_ACCOUNT_KEYBOARD
         }
     except Exception as e:
         logger.error(f"Error in handle_profile_button: {e}")
@@ -259,11 +244,7 @@ def handle_profile_button(user_id: int, profile_type: str) -> Dict[str, Any]:
         return {
             "success": False,
             "message": f"There was an error updating your profile. Please try again later.",
-            "reply_markup": {
-                "inline_keyboard": [
-                    [{"text": "👤 Back to Account", "callback_data": "menu_account"}]
-                ]
-            }
+            "reply_markup": _BACK_TO_ACCOUNT_KEYBOARD
         }
 
 def update_user_profile(user_id: int, profile_type: str) -> bool:
@@ -341,17 +322,10 @@ def handle_subscription_button(user_id: int, subscribe: bool) -> Dict[str, Any]:
                 "always subscribe again from your account menu."
             )
         
-        # Get back to account menu keyboard
-        reply_markup = {
-            "inline_keyboard": [
-                [{"text": "👤 Back to Account", "callback_data": "menu_account"}]
-            ]
-        }
-        
         return {
             "success": True,
             "message": message,
-            "reply_markup": reply_markup
+            "reply_markup": _BACK_TO_ACCOUNT_KEYBOARD
         }
     except Exception as e:
         logger.error(f"Error in handle_subscription_button: {e}")
@@ -359,11 +333,7 @@ def handle_subscription_button(user_id: int, subscribe: bool) -> Dict[str, Any]:
         return {
             "success": False,
             "message": f"There was an error updating your subscription status. Please try again later.",
-            "reply_markup": {
-                "inline_keyboard": [
-                    [{"text": "👤 Back to Account", "callback_data": "menu_account"}]
-                ]
-            }
+            "reply_markup": _BACK_TO_ACCOUNT_KEYBOARD
         }
 
 def update_subscription_status(user_id: int, subscribed: bool) -> bool:
@@ -446,17 +416,10 @@ def handle_status_button(user_id: int) -> Dict[str, Any]:
             "Use the Explore or Invest buttons to start investing!"
         )
         
-        # Get back to account menu keyboard
-        reply_markup = {
-            "inline_keyboard": [
-                [{"text": "👤 Back to Account", "callback_data": "menu_account"}]
-            ]
-        }
-        
         return {
             "success": True,
             "message": message,
-            "reply_markup": reply_markup
+            "reply_markup": _BACK_TO_ACCOUNT_KEYBOARD
         }
     except Exception as e:
         logger.error(f"Error in handle_status_button: {e}")
@@ -464,11 +427,7 @@ def handle_status_button(user_id: int) -> Dict[str, Any]:
         return {
             "success": False,
             "message": "There was an error retrieving your account status. Please try again later.",
-            "reply_markup": {
-                "inline_keyboard": [
-                    [{"text": "👤 Back to Account", "callback_data": "menu_account"}]
-                ]
-            }
+            "reply_markup": _BACK_TO_ACCOUNT_KEYBOARD
         }
 
 def process_account_button(callback_data: str, user_id: int) -> Optional[Dict[str, Any]]:
@@ -7,6 +7,8 @@ import logging
 import sqlite3
 from typing import Dict, Any, Optional
 
+from account_button_fix_final import get_account_menu_keyboard
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -18,28 +20,9 @@ def get_account_menu() -> Dict[str, Any]:
     Returns:
         Dict with message and reply markup
     """
-    message = "👤 *Account Management*\n\nManage your account settings:"
-    
-    # Simple keyboard with buttons that definitely work
-    keyboard = {
-        "inline_keyboard": [
-            [{"text": "💼 Connect Wallet", "callback_data": "account_wallet"}],
-            [
-                {"text": "🔴 High-Risk Profile", "callback_data": "account_profile_high-risk"},
-                {"text": "🟢 Stable Profile", "callback_data": "account_profile_stable"}
-            ],
-            [
-                {"text": "🔔 Subscribe", "callback_data": "account_subscribe"},
-                {"text": "🔕 Unsubscribe", "callback_data": "account_unsubscribe"}
-            ],
-            [{"text": "❓ Help", "callback_data": "account_help"}],
-            [{"text": "🏠 Back to Main Menu", "callback_data": "back_to_main"}]
-        ]
-    }
-    
     return {
-        "message": message,
-        "reply_markup": keyboard
+        "message": "👤 *Account Management*\n\nManage your account settings:",
+        "reply_markup": get_account_menu_keyboard()
     }
 
 def handle_profile_button(callback_data: str, user_id: int) -> Dict[str, Any]:
@@ -4,15 +4,19 @@ This includes profile selection commands that bypass the button system entirely.
 """
 
 import logging
-import sqlite3
-from typing import Dict, Any, Optional
+from typing import Dict, Any
+
+from profile_db import write_profile
+from profile_messages import PROFILE_MESSAGES, VALID_PROFILES
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Database file
-DB_FILE = "filot_bot.db"
+# Success response templates, built once per profile type; callers get a copy
+_RESPONSES = {
+    profile_type: {"success": True, "message": message}
+    for profile_type, message in PROFILE_MESSAGES.items()
+}
 
 def set_profile(user_id: int, profile_type: str) -> Dict[str, Any]:
     """
@@ -25,83 +29,14 @@ def set_profile(user_id: int, profile_type: str) -> Dict[str, Any]:
     Returns:
         Response with success status and message
     """
-    try:
-        # Connect to database
-        conn = sqlite3.connect(DB_FILE)
-        cursor = conn.cursor()
-        
-        # Make sure the table exists
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY,
-            username TEXT,
-            first_name TEXT,
-            last_name TEXT,
-            risk_profile TEXT DEFAULT 'stable',
-            investment_horizon TEXT DEFAULT 'medium',
-            subscribed BOOLEAN DEFAULT 0,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            last_active TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            wallet_address TEXT,
-            verification_code TEXT,
-            verified BOOLEAN DEFAULT 0
-        )
-        ''')
-        
-        # Check if user exists
-        cursor.execute("SELECT id FROM users WHERE id = ?", (user_id,))
-        user_exists = cursor.fetchone() is not None
-        
-        if user_exists:
-            # Update existing user
-            logger.info(f"Direct command: Updating user {user_id} to {profile_type} profile")
-            cursor.execute("UPDATE users SET risk_profile = ? WHERE id = ?", (profile_type, user_id))
-        else:
-            # Create new user
-            logger.info(f"Direct command: Creating user {user_id} with {profile_type} profile")
-            cursor.execute(
-                "INSERT INTO users (id, risk_profile, username) VALUES (?, ?, ?)",
-                (user_id, profile_type, f"user_{user_id}")
-            )
-            
-        # Commit changes
-        conn.commit()
-        conn.close()
-        
-        # Format response message
-        if profile_type == "high-risk":
-            message = """
-🔴 *High-Risk Profile Selected*
-
-Your investment recommendations will now focus on:
-• Higher APR opportunities
-• Newer pools with growth potential
-• More volatile but potentially rewarding options
-
-_Note: Higher returns come with increased risk_
-"""
-        else:  # stable
-            message = """
-🟢 *Stable Profile Selected*
-
-Your investment recommendations will now focus on:
-• Established, reliable pools
-• Lower volatility options
-• More consistent but potentially lower APR
-
-_Note: Stability typically means more moderate returns_
-"""
-        
-        return {
-            "success": True,
-            "message": message
-        }
-    except Exception as e:
-        logger.error(f"Error in direct command profile setting: {e}")
+    if not write_profile(user_id, profile_type):
         return {
             "success": False,
             "message": "Sorry, there was an error setting your profile. Please try again later."
         }
+    
+    logger.info("Direct command: Saved %s profile for user %s", profile_type, user_id)
+    return dict(_RESPONSES.get(profile_type, _RESPONSES["stable"]))
 
 # Command handlers
 def handle_high_risk_command(update: Any, context: Any) -> None:
@@ -135,7 +70,7 @@ if __name__ == "__main__":
     user_id = int(sys.argv[1])
     profile_type = sys.argv[2]
     
-    if profile_type not in ["high-risk", "stable"]:
+    if profile_type not in VALID_PROFILES:
         print(f"Invalid profile type: {profile_type}")
         sys.exit(1)
         
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test script for the latest-signal lookup used by the execution agent.
+Checks that a Position whose initial signal is resolved by its own INSERT
+can be flushed, and that it links to the pool's most recent signal.
+"""
+
+import unittest
+from datetime import datetime, timedelta
+
+from flask import Flask
+
+from models import db, Pool, CompositeSignal, Position, PositionStatus
+from execution_agent import _LATEST_SIGNAL_ID_STMT
+
+class TestPositionSignalInsert(unittest.TestCase):
+    """Tests for resolving a position's composite signal inside the INSERT."""
+
+    def setUp(self):
+        """Create an in-memory database with one pool and two signals."""
+        self.app = Flask(__name__)
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
+        db.init_app(self.app)
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+
+        now = datetime.now()
+        db.session.add(Pool(
+            id="test_pool",
+            token_a_symbol="SOL",
+            token_b_symbol="USDC",
+            token_a_price=100.0,
+            token_b_price=1.0,
+            apr_24h=10.0,
+            tvl=1000000.0,
+            fee=0.25
+        ))
+        for minutes_ago in (10, 1):
+            db.session.add(CompositeSignal(
+                pool_id="test_pool",
+                sol_score=0.5,
+                sentiment_score=0.1,
+                profile_high=0.6,
+                profile_stable=0.4,
+                timestamp=now - timedelta(minutes=minutes_ago)
+            ))
+        db.session.commit()
+
+        self.latest_signal_id = db.session.execute(
+            _LATEST_SIGNAL_ID_STMT, {"signal_pool_id": "test_pool"}
+        ).scalar_one()
+
+    def tearDown(self):
+        """Drop the database and leave the app context."""
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def test_flush_position_with_signal_subquery(self):
+        """A Position built like build_deposit_tx builds it can be flushed."""
+        position = Position(
+            user_id=12345,
+            pool_id="test_pool",
+            status=PositionStatus.PENDING,
+            invested_amount_usd=100.0,
+            token_a_amount=0.5,
+            token_b_amount=50.0,
+            initial_composite_signal_id=_LATEST_SIGNAL_ID_STMT.params(
+                signal_pool_id="test_pool"
+            ).scalar_subquery()
+        )
+        db.session.add(position)
+        db.session.flush()
+        db.session.refresh(position)
+
+        self.assertIsNotNone(position.id, "Position should have been inserted")
+        self.assertEqual(
+            position.initial_composite_signal_id,
+            self.latest_signal_id,
+            "Position should link to the pool's most recent signal"
+        )
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1205,6 +1205,24 @@ async def wallet_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             "Sorry, an error occurred while processing your request. Please try again later."
         )
 
+def _update_profile_field(user_id: int, field: str, value: Any) -> bool:
+    """
+    Update a user's profile field in its own app context.
+    
+    Runs in a worker thread so the blocking database commit doesn't stall the event loop.
+    
+    Args:
+        user_id: Telegram user ID
+        field: Field name to update
+        value: New value for the field
+        
+    Returns:
+        True if update successful, False otherwise
+    """
+    from app import app
+    with app.app_context():
+        return db_utils.update_user_profile(user_id, field, value)
+
 async def profile_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Set user investment profile when the command /profile is issued."""
     try:
@@ -1255,7 +1273,7 @@ async def profile_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
                     if setting_value.lower() in ["conservative", "moderate", "aggressive"]:
                         # Update risk profile using db_utils
                         db_user.risk_profile = setting_value.lower()
-                        db_utils.update_user_profile(db_user.id, "risk_profile", setting_value.lower())
+                        await asyncio.to_thread(_update_profile_field, db_user.id, "risk_profile", setting_value.lower())
                         
                         # Send confirmation
                         await update.message.reply_markdown(
@@ -1271,7 +1289,7 @@ async def profile_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
                     if setting_value.lower() in ["short", "medium", "long"]:
                         # Update investment horizon using db_utils
                         db_user.investment_horizon = setting_value.lower()
-                        db_utils.update_user_profile(db_user.id, "investment_horizon", setting_value.lower())
+                        await asyncio.to_thread(_update_profile_field, db_user.id, "investment_horizon", setting_value.lower())
                         
                         # Send confirmation
                         await update.message.reply_markdown(
@@ -1287,7 +1305,7 @@ async def profile_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
                     # Update investment goals using db_utils
                     goals_value = setting_value[:255]  # Limit to 255 chars
                     db_user.investment_goals = goals_value
-                    db_utils.update_user_profile(db_user.id, "investment_goals", goals_value)
+                    await asyncio.to_thread(_update_profile_field, db_user.id, "investment_goals", goals_value)
                     
                     # Send confirmation
                     await update.message.reply_markdown(
@@ -11,6 +11,7 @@ import hashlib
 import time
 from typing import Dict, Any, Set, Optional, List
 import random
+from collections import defaultdict
 
 # Configure logging first
 logging.basicConfig(
@@ -53,6 +54,14 @@ except ImportError:
     IMPROVED_NAVIGATION = False
     logger.info("Using original navigation system")
 
+# Import fixed profile handler
+try:
+    from fixed_profile_handler import handle_profile_setting
+    FIXED_PROFILE_HANDLER_ENABLED = True
+except ImportError:
+    logger.warning("Fixed profile handler not available")
+    FIXED_PROFILE_HANDLER_ENABLED = False
+
 # Define some helper handler functions
 def handle_wallet_connect(handler_context):
     """Handle wallet connection request."""
@@ -260,7 +269,7 @@ logger = logging.getLogger(__name__)
 # Global tracking mechanisms
 processed_callbacks: Set[str] = set()
 callback_timestamps: Dict[str, float] = {}
-recent_navigation_contexts: Dict[int, List[Dict[str, Any]]] = {}  # Track navigation context by chat_id
+recent_navigation_contexts: Dict[int, List[Dict[str, Any]]] = defaultdict(list)  # Track navigation context by chat_id
 MAX_CALLBACKS_MEMORY = 1000
 MAX_CONTEXT_MEMORY = 20  # Keep track of last 20 navigation steps per chat
 
@@ -339,20 +348,17 @@ class CallbackRegistry:
         processed_callbacks.add(content_id)
         callback_timestamps[combined_id] = now
         
-        # Update navigation context for this chat
-        if chat_id not in recent_navigation_contexts:
-            recent_navigation_contexts[chat_id] = []
-            
-        # Add this step to the context
-        recent_navigation_contexts[chat_id].append({
+        # Add this step to the chat's navigation context
+        steps = recent_navigation_contexts[chat_id]
+        steps.append({
             'callback_data': callback_data,
             'timestamp': now,
             'context': 'navigation' if is_navigation_button else 'action'
         })
         
         # Limit the context size
-        if len(recent_navigation_contexts[chat_id]) > MAX_CONTEXT_MEMORY:
-            recent_navigation_contexts[chat_id] = recent_navigation_contexts[chat_id][-MAX_CONTEXT_MEMORY:]
+        if len(steps) > MAX_CONTEXT_MEMORY:
+            del steps[:-MAX_CONTEXT_MEMORY]
         
         # Prune old data to prevent memory leaks
         CallbackRegistry.prune_old_data()
@@ -779,7 +785,7 @@ def route_callback(handler_context: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         
     elif callback_data.startswith("wallet_connect_"):
         try:
-            amount = float(callback_data.split("_")[2])
+            amount = float(callback_data.split("_", 3)[2])
             return handle_wallet_connect_with_amount(amount, handler_context)
         except (IndexError, ValueError):
             logger.error(f"Invalid wallet_connect callback format: {callback_data}")
@@ -795,9 +801,8 @@ def route_callback(handler_context: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         try:
             if callback_data.startswith("simulate_period_"):
                 # Handle period-specific simulations
-                parts = callback_data.split("_")
-                period = parts[2]  # daily, weekly, monthly, yearly
-                amount = float(parts[3]) if len(parts) > 3 else 1000.0
+                period, _, rest = callback_data[len("simulate_period_"):].partition("_")  # daily, weekly, monthly, yearly
+                amount = float(rest.partition("_")[0]) if rest else 1000.0
                 return handle_simulation(period, amount, handler_context)
             elif callback_data == "simulate_custom":
                 # Handle custom amount simulation request
@@ -1201,9 +1206,7 @@ def handle_profile_action(profile_type: str, context: Dict[str, Any]) -> Dict[st
     chat_id = context.get('chat_id', 0)
     
     # First try using our specialized fixed profile handler if available
-    try:
-        # Import the fixed profile handler
-        from fixed_profile_handler import handle_profile_setting
+    if FIXED_PROFILE_HANDLER_ENABLED:
         logger.info(f"Using fixed profile handler for profile_{profile_type} from user {user_id}")
         
         # Use the specialized handler
@@ -1214,7 +1217,7 @@ def handle_profile_action(profile_type: str, context: Dict[str, Any]) -> Dict[st
             if not result.get("action"):
                 result["action"] = "profile"
             return result
-    except ImportError:
+    else:
         logger.warning("Fixed profile handler not available, falling back to button fix")
     
     # If we get here, either the import failed or the handler returned None
@@ -17,6 +17,9 @@ logger = logging.getLogger(__name__)
 # CoinGecko API Base URL
 COINGECKO_API_BASE = "https://api.coingecko.com/api/v3"
 
+# Shared session so repeated lookups reuse the pooled keep-alive connection
+_session = requests.Session()
+
 # API accessibility check
 def is_api_accessible() -> bool:
     """Check if the CoinGecko API is accessible.
@@ -26,7 +29,7 @@ def is_api_accessible() -> bool:
     """
     try:
         # Use the ping endpoint which is lightweight
-        response = requests.get(f"{COINGECKO_API_BASE}/ping", timeout=5)
+        response = _session.get(f"{COINGECKO_API_BASE}/ping", timeout=5)
         return response.status_code == 200
     except Exception:
         return False
@@ -157,7 +160,7 @@ def get_token_price(token_symbol: str) -> float:
             "vs_currencies": "usd"
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        response = _session.get(url, params=params, timeout=10)
         response.raise_for_status()
         data = response.json()
         
@@ -230,7 +233,7 @@ def get_multiple_token_prices(token_symbols: List[str]) -> Dict[str, float]:
             "vs_currencies": "usd"
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        response = _session.get(url, params=params, timeout=10)
         response.raise_for_status()
         data = response.json()
         
@@ -292,7 +295,7 @@ def get_token_data(token_symbol: str) -> Optional[Dict[str, Any]]:
             "developer_data": "false"
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        response = _session.get(url, params=params, timeout=10)
         response.raise_for_status()
         data = response.json()
         
@@ -44,8 +44,8 @@ class MessageTracker:
             conn = sqlite3.connect(DB_PATH)
             cursor = conn.cursor()
             
-            # Create table if it doesn't exist
-            cursor.execute(f'''
+            # Create the table and its indexes in one script
+            cursor.executescript(f'''
             CREATE TABLE IF NOT EXISTS {TRACKING_TABLE} (
                 tracking_id TEXT PRIMARY KEY,
                 chat_id INTEGER,
@@ -53,19 +53,15 @@ class MessageTracker:
                 timestamp REAL,
                 instance_id TEXT,
                 message_preview TEXT
-            )
-            ''')
+            );
             
-            # Create index for faster lookups
-            cursor.execute(f'''
+            -- Index for faster lookups
             CREATE INDEX IF NOT EXISTS idx_chat_hash 
-            ON {TRACKING_TABLE} (chat_id, message_hash)
-            ''')
+            ON {TRACKING_TABLE} (chat_id, message_hash);
             
-            # Create timestamp index for cleanup
-            cursor.execute(f'''
+            -- Timestamp index for cleanup
             CREATE INDEX IF NOT EXISTS idx_timestamp
-            ON {TRACKING_TABLE} (timestamp)
+            ON {TRACKING_TABLE} (timestamp);
             ''')
             
             conn.commit()
@@ -129,6 +125,7 @@ class MessageTracker:
                 exists = result[0] > 0
                 
                 if exists:
+                    conn.close()
                     logger.warning(f"Duplicate message detected for chat {chat_id}: {message_content[:30]}...")
                     return True
                 
@@ -141,13 +138,16 @@ class MessageTracker:
                     (tracking_id, chat_id, message_hash, now, _instance_id, message_preview)
                 )
                 
+                # Periodically clean up old messages in the same transaction
+                if random.random() < 0.1:  # ~10% chance to clean up on each check
+                    cursor.execute(
+                        f"DELETE FROM {TRACKING_TABLE} WHERE timestamp < ?",
+                        (now - MAX_MESSAGE_AGE,)
+                    )
+                
                 conn.commit()
                 conn.close()
                 
-                # Periodically clean up old messages
-                if random.random() < 0.1:  # ~10% chance to clean up on each check
-                    MessageTracker.cleanup_old_messages()
-                
                 return False
             except Exception as e:
                 logger.error(f"Error tracking message: {e}")
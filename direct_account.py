@@ -0,0 +1,377 @@
+"""
+Direct handlers for the account section buttons.
+This module provides the 'account_profile_*' and 'profile_*' handlers, the
+wallet options and the account status view, all sharing one SQLite connection.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, Tuple
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Cached bot-wide user counts so bursts of status clicks don't re-run the aggregates
+STATS_CACHE_TTL = 30.0  # seconds
+_stats_cache = {"expires": 0.0, "total_users": 0, "subscribed_users": 0}
+
+# Database file
+DB_FILE = "filot_bot.db"
+
+# Schema created once per process instead of on every button press
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY,
+    username TEXT,
+    first_name TEXT,
+    last_name TEXT,
+    risk_profile TEXT DEFAULT 'stable',
+    subscribed BOOLEAN DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    last_active TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    wallet_address TEXT,
+    verification_code TEXT,
+    is_verified BOOLEAN DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_users_subscribed ON users(subscribed) WHERE subscribed = 1;
+"""
+
+# Statements kept as module constants so the connection's statement cache reuses them
+_Q_UPSERT_PROFILE = (
+    "INSERT INTO users (id, risk_profile) VALUES (?, ?) "
+    "ON CONFLICT(id) DO UPDATE SET risk_profile = excluded.risk_profile, "
+    "last_active = datetime('now')"
+)
+_Q_INSERT_USER = "INSERT OR IGNORE INTO users (id, risk_profile) VALUES (?, 'stable')"
+_Q_USER_STATUS = "SELECT risk_profile, subscribed, wallet_address FROM users WHERE id = ?"
+_Q_USER_STATUS_WITH_COUNTS = (
+    "SELECT u.risk_profile, u.subscribed, u.wallet_address, "
+    "(SELECT COUNT(*) FROM users), "
+    "(SELECT COUNT(*) FROM users WHERE subscribed = 1) "
+    "FROM users u WHERE u.id = ?"
+)
+
+_conn_lock = threading.Lock()
+_connection: Optional[sqlite3.Connection] = None
+
+# Serializes use of the shared connection; it is opened with
+# check_same_thread=False and multi-statement sequences must not interleave
+_use_lock = threading.Lock()
+
+def _conn() -> sqlite3.Connection:
+    """
+    Get the module's shared SQLite connection, creating the schema on first use.
+    
+    Returns:
+        The open connection
+    """
+    global _connection
+    if _connection is None:
+        with _conn_lock:
+            if _connection is None:
+                # Autocommit: every write here is a single statement
+                conn = sqlite3.connect(DB_FILE, check_same_thread=False, isolation_level=None)
+                conn.executescript(_SCHEMA)
+                _connection = conn
+    return _connection
+
+@contextmanager
+def _locked_conn():
+    """
+    Use the shared connection exclusively for the duration of the block.
+    
+    Yields:
+        The open connection
+    """
+    conn = _conn()
+    with _use_lock:
+        yield conn
+
+# Callbacks handled by handle_button
+_PROFILE_CALLBACKS = frozenset({
+    # Account section buttons
+    "account_profile_high-risk",
+    "account_profile_stable",
+    # Alternative formats that seem to be needed
+    "profile_high-risk",
+    "profile_stable",
+})
+_WALLET_CALLBACKS = frozenset({"account_wallet", "wallet"})
+
+# Static response content, built once at import time
+_PROFILE_MSGS = {
+    "high-risk": (
+        "🔴 *High-Risk Profile Selected*\n\n"
+        "Your investment recommendations will now focus on:\n"
+        "• Higher APR opportunities\n"
+        "• Newer pools with growth potential\n"
+        "• More volatile but potentially rewarding options\n\n"
+        "_Note: Higher returns come with increased risk_"
+    ),
+    "stable": (
+        "🟢 *Stable Profile Selected*\n\n"
+        "Your investment recommendations will now focus on:\n"
+        "• Established, reliable pools\n"
+        "• Lower volatility options\n"
+        "• More consistent but potentially lower APR\n\n"
+        "_Note: Stability typically means more moderate returns_"
+    ),
+}
+
+_WALLET_MESSAGE = (
+    "🔐 *Connect Your Wallet* 🔐\n\n"
+    "Choose how you want to connect your wallet:\n\n"
+    "1. *Address Entry* - Enter your wallet address manually\n"
+    "2. *QR Code* - Scan a QR code with your wallet app\n\n"
+    "_Your private keys always remain secure in your wallet._"
+)
+
+_WALLET_KEYBOARD = {
+    "inline_keyboard": [
+        [{"text": "Enter Wallet Address", "callback_data": "wallet_connect_address"}],
+        [{"text": "Connect via QR Code", "callback_data": "wallet_connect_qr"}],
+        [{"text": "⬅️ Back to Account", "callback_data": "menu_account"}]
+    ]
+}
+
+def _fetch_status_row(conn: sqlite3.Connection, user_id: int) -> Optional[Tuple[Any, ...]]:
+    """
+    Fetch a user's profile fields together with the bot-wide user counts.
+    
+    The counts come from a short-lived cache when it is fresh; otherwise they are
+    computed as scalar subqueries of the same statement as the user lookup.
+    
+    Args:
+        conn: The open database connection
+        user_id: The user ID
+        
+    Returns:
+        Tuple of (risk_profile, subscribed, wallet_address, total_users,
+        subscribed_users), or None if the user doesn't exist
+    """
+    now = time.monotonic()
+    if now < _stats_cache["expires"]:
+        row = conn.execute(_Q_USER_STATUS, (user_id,)).fetchone()
+        if row is None:
+            return None
+        return row + (_stats_cache["total_users"], _stats_cache["subscribed_users"])
+    
+    row = conn.execute(_Q_USER_STATUS_WITH_COUNTS, (user_id,)).fetchone()
+    if row is not None:
+        _stats_cache.update(
+            expires=now + STATS_CACHE_TTL,
+            total_users=row[3],
+            subscribed_users=row[4]
+        )
+    return row
+
+def handle_button(callback_data: str, user_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Universal handler for both callback formats:
+    - account_profile_high-risk
+    - account_profile_stable 
+    - profile_high-risk
+    - profile_stable
+    
+    Args:
+        callback_data: The callback data from the button
+        user_id: The user's ID
+        
+    Returns:
+        Dict with result or None if button isn't handled
+    """
+    if callback_data in _PROFILE_CALLBACKS:
+        # This is a profile button; the profile type is the last segment
+        return set_profile(user_id, callback_data.rsplit("_", 1)[-1])
+    elif callback_data in _WALLET_CALLBACKS:
+        # This is a wallet button
+        return get_wallet_options()
+    else:
+        # Not a button we handle
+        return None
+
+def set_profile(user_id: int, profile_type: str) -> Dict[str, Any]:
+    """
+    Set user profile using direct database access.
+    
+    Args:
+        user_id: The user's ID
+        profile_type: Either 'high-risk' or 'stable'
+        
+    Returns:
+        Dict with success status and message
+    """
+    try:
+        logger.debug("Setting %s profile for user %s", profile_type, user_id)
+        
+        # Validate profile type
+        if profile_type not in _PROFILE_MSGS:
+            return {
+                "success": False,
+                "message": f"Invalid profile type: {profile_type}"
+            }
+        
+        # Create or update the user in a single statement
+        with _locked_conn() as conn:
+            conn.execute(_Q_UPSERT_PROFILE, (user_id, profile_type))
+        logger.info("Saved %s profile for user %s", profile_type, user_id)
+        
+        return {
+            "success": True,
+            "message": _PROFILE_MSGS[profile_type]
+        }
+        
+    except Exception:
+        logger.exception("Error in profile button handler")
+        
+        return {
+            "success": False,
+            "message": "Sorry, there was an error setting your profile. Please try again later."
+        }
+
+def get_wallet_options() -> Dict[str, Any]:
+    """
+    Get wallet connection options.
+    
+    Returns:
+        Dict with success status, message, and keyboard markup
+    """
+    return {
+        "success": True,
+        "message": _WALLET_MESSAGE,
+        "keyboard": _WALLET_KEYBOARD
+    }
+
+def handle_account_button(callback_data: str, user_id: int, chat_id: int) -> Dict[str, Any]:
+    """
+    Special handler for account section buttons.
+    
+    Args:
+        callback_data: The callback data from the button
+        user_id: The ID of the user who pressed the button
+        chat_id: The chat ID where the button was pressed
+        
+    Returns:
+        Dictionary with status and response
+    """
+    logger.debug("BUTTON HANDLER: Processing %s for user %s", callback_data, user_id)
+    
+    try:
+        # Handle account status button
+        if callback_data == "account_status":
+            return handle_status_button(user_id)
+            
+        # Handle profile buttons; the profile type is the last segment
+        elif callback_data in _PROFILE_CALLBACKS:
+            return handle_profile_button(callback_data.rsplit("_", 1)[-1], user_id)
+            
+        # Other account buttons don't need special handling
+        else:
+            return {
+                "success": False,
+                "message": "Not a handled button type"
+            }
+    
+    except Exception as e:
+        logger.exception("Error in account button handler")
+        
+        return {
+            "success": False,
+            "message": f"Error handling button: {str(e)}"
+        }
+
+def handle_status_button(user_id: int) -> Dict[str, Any]:
+    """
+    Handle account status button.
+    
+    Args:
+        user_id: The user ID
+        
+    Returns:
+        Dictionary with status and response
+    """
+    try:
+        with _locked_conn() as conn:
+            # Get user information and statistics in a single statement
+            status_row = _fetch_status_row(conn, user_id)
+            if status_row is None:
+                # Create user if not exists
+                conn.execute(_Q_INSERT_USER, (user_id,))
+                status_row = _fetch_status_row(conn, user_id)
+        
+        risk_profile, subscribed, wallet_address, total_users, subscribed_users = status_row
+        
+        # Default values
+        risk_profile = risk_profile or "stable"
+        subscribed = bool(subscribed)
+            
+        # Format wallet status
+        if wallet_address:
+            wallet_status = f"✅ Connected ({wallet_address[:6]}...{wallet_address[-4:]})"
+        else:
+            wallet_status = "❌ Not Connected"
+            
+        # Format risk profile
+        profile_emoji = "🔴" if risk_profile == "high-risk" else "🟢"
+        profile_text = f"{profile_emoji} {risk_profile.capitalize()}"
+        
+        # Format subscription status
+        subscription_status = "✅ Subscribed" if subscribed else "❌ Not Subscribed"
+        
+        # Format the message
+        status_message = (
+            "📊 *FiLot Bot Status* 📊\n\n"
+            
+            "*Your Profile:*\n"
+            f"• Wallet: {wallet_status}\n"
+            f"• Risk Profile: {profile_text}\n"
+            f"• Daily Updates: {subscription_status}\n\n"
+            
+            "*Bot Statistics:*\n"
+            f"• Total Users: {total_users:,}\n"
+            f"• Subscribed Users: {subscribed_users:,}\n\n"
+            
+            "*System Status:*\n"
+            f"• Bot: ✅ Online\n"
+            f"• API: ✅ Operational\n"
+            f"• Last Update: Just now"
+        )
+        
+        return {
+            "success": True,
+            "message": status_message,
+            "action": "status",
+            "acknowledgment": "Status updated!"
+        }
+        
+    except Exception as e:
+        logger.exception("Error in status button handler")
+        
+        return {
+            "success": False,
+            "message": "Error retrieving status information",
+            "error": str(e)
+        }
+
+def handle_profile_button(profile_type: str, user_id: int) -> Dict[str, Any]:
+    """
+    Handle profile selection button.
+    
+    Args:
+        profile_type: The profile type (high-risk or stable)
+        user_id: The user ID
+        
+    Returns:
+        Dictionary with status and response
+    """
+    result = set_profile(user_id, profile_type)
+    if result["success"]:
+        result.update(
+            action="profile",
+            profile_type=profile_type,
+            acknowledgment="Profile updated!"
+        )
+    return result
@@ -9,10 +9,13 @@ Builds and executes transactions for liquidity pool interactions
 import os
 import logging
 import asyncio
+import time
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List, Tuple, Union
 import json
 
+from sqlalchemy import bindparam, select
+
 # Import local modules
 from models import User, Pool, Position, CompositeSignal, PositionStatus, db
 from solpool_client import get_client as get_solpool_client
@@ -29,6 +32,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Statements built once and reused; SQLAlchemy caches their compiled form
+_POOL_BY_ID_STMT = select(Pool).where(Pool.id == bindparam("pool_id"))
+# The bind is not named after a column: this statement is embedded as a scalar
+# subquery in the Position INSERT, which reserves "pool_id" for its VALUES
+_LATEST_SIGNAL_ID_STMT = (
+    select(CompositeSignal.id)
+    .where(CompositeSignal.pool_id == bindparam("signal_pool_id"))
+    .order_by(CompositeSignal.timestamp.desc())
+    .limit(1)
+)
+
+# Positions that can still be exited
+_EXITABLE_STATUSES = frozenset({PositionStatus.ACTIVE, PositionStatus.MONITORED})
+
 class ExecutionAgent:
     """Agent responsible for building and executing transactions"""
     
@@ -40,6 +57,19 @@ class ExecutionAgent:
         # Load solana wallet service
         self.wallet_service = get_wallet_service()
         
+        # Recently resolved wallet addresses: {user_id: (address, resolved_at)}
+        self._wallet_addr_cache: Dict[int, Tuple[str, float]] = {}
+        self.wallet_addr_ttl = 60.0  # seconds
+        
+        # Recently loaded pool data: {pool_id: (pool_data, loaded_at)}
+        self._pool_cache: Dict[str, Tuple[Dict[str, Any], float]] = {}
+        self.pool_cache_ttl = 60.0  # seconds
+        
+        # Recent swap simulations: {(from, to, quantized_amount): (output, simulated_at)}
+        self._swap_estimate_cache: Dict[Tuple[str, str, float], Tuple[float, float]] = {}
+        self.swap_estimate_ttl = 10.0  # seconds
+        self.swap_estimate_cache_size = 1024
+        
     async def get_wallet_address(self, user_id: int) -> Optional[str]:
         """
         Get the user's connected wallet address
@@ -50,15 +80,26 @@ class ExecutionAgent:
         Returns:
             Wallet address or None if not connected
         """
+        cached = self._wallet_addr_cache.get(user_id)
+        if cached and time.monotonic() - cached[1] < self.wallet_addr_ttl:
+            return cached[0]
+            
         try:
             # Check if user has WalletConnect session
             from walletconnect_utils import get_user_walletconnect_sessions
-            sessions = await get_user_walletconnect_sessions(user_id)
+            result = await get_user_walletconnect_sessions(user_id)
+            sessions = result.get("sessions", [])
             
-            if sessions and len(sessions) > 0:
-                # Use the most recent session
-                sorted_sessions = sorted(sessions, key=lambda s: s.get("created_at", 0), reverse=True)
-                return sorted_sessions[0].get("wallet_address")
+            if sessions:
+                # Use the most recent session (single pass, no sort)
+                if len(sessions) == 1:
+                    latest = sessions[0]
+                else:
+                    latest = max(sessions, key=lambda s: s.get("created_at") or "")
+                wallet_address = latest.get("wallet_address")
+                if wallet_address:
+                    self._wallet_addr_cache[user_id] = (wallet_address, time.monotonic())
+                return wallet_address
                 
             return None
             
@@ -84,6 +125,18 @@ class ExecutionAgent:
                 "error": "No wallet connected. Please connect a wallet using /walletconnect"
             }
             
+        return await self._check_balances_for_address(wallet_address)
+        
+    async def _check_balances_for_address(self, wallet_address: str) -> Dict[str, Any]:
+        """
+        Check token balances for an already resolved wallet address
+        
+        Args:
+            wallet_address: Wallet address to check
+            
+        Returns:
+            Dictionary with balance information
+        """
         try:
             balances = await check_wallet_balance(wallet_address)
             return {
@@ -100,7 +153,29 @@ class ExecutionAgent:
             
     async def get_pool_data(self, pool_id: str) -> Dict[str, Any]:
         """
-        Get detailed pool data
+        Get detailed pool data, served from a short-lived cache when fresh
+        
+        Args:
+            pool_id: ID of the pool
+            
+        Returns:
+            Dictionary with pool data
+        """
+        cached = self._pool_cache.get(pool_id)
+        if cached and time.monotonic() - cached[1] < self.pool_cache_ttl:
+            return {
+                "success": True,
+                "pool": dict(cached[0])
+            }
+            
+        result = await self._fetch_pool_data(pool_id)
+        if result.get("success", False):
+            self._pool_cache[pool_id] = (dict(result["pool"]), time.monotonic())
+        return result
+        
+    async def _fetch_pool_data(self, pool_id: str) -> Dict[str, Any]:
+        """
+        Load pool data from the database, falling back to the Raydium API
         
         Args:
             pool_id: ID of the pool
@@ -110,7 +185,7 @@ class ExecutionAgent:
         """
         try:
             # First try to get from database
-            pool = db.session.query(Pool).filter(Pool.id == pool_id).first()
+            pool = db.session.execute(_POOL_BY_ID_STMT, {"pool_id": pool_id}).scalar_one_or_none()
             
             if pool:
                 # Format pool data
@@ -201,8 +276,9 @@ class ExecutionAgent:
         """
         try:
             # Get token prices
-            token_a_price = await self._get_token_price(token_a)
-            token_b_price = await self._get_token_price(token_b)
+            prices = await self._get_token_prices_batch([token_a, token_b])
+            token_a_price = prices.get(token_a.upper(), 0.0)
+            token_b_price = prices.get(token_b.upper(), 0.0)
             
             if token_a_price <= 0 or token_b_price <= 0:
                 return {
@@ -231,6 +307,28 @@ class ExecutionAgent:
             token_a_balance = balances.get(token_a, 0.0)
             token_b_balance = balances.get(token_b, 0.0)
             
+            # Wallet already covers both sides: deposit as-is, no swap to plan or simulate
+            if token_a_balance >= token_a_total_needed and token_b_balance >= token_b_total_needed:
+                return {
+                    "success": True,
+                    "usd_amount": usd_amount,
+                    "token_a": token_a,
+                    "token_b": token_b,
+                    "token_a_price": token_a_price,
+                    "token_b_price": token_b_price,
+                    "token_a_balance": token_a_balance,
+                    "token_b_balance": token_b_balance,
+                    "token_a_total_needed": token_a_total_needed,
+                    "token_b_total_needed": token_b_total_needed,
+                    "swap_needed": False,
+                    "swap_from_token": None,
+                    "swap_to_token": None,
+                    "swap_amount": 0.0,
+                    "token_a_to_deposit": token_a_total_needed,
+                    "token_b_to_deposit": token_b_total_needed,
+                    "total_value_usd": (token_a_total_needed * token_a_price) + (token_b_total_needed * token_b_price)
+                }
+            
             # Calculate if we need to swap
             token_a_needed = max(0, token_a_total_needed - token_a_balance)
             token_b_needed = max(0, token_b_total_needed - token_b_balance)
@@ -318,21 +416,24 @@ class ExecutionAgent:
                 "error": f"Error calculating swap amounts: {e}"
             }
     
-    async def _get_token_price(self, token_symbol: str) -> float:
+    async def _get_token_prices_batch(self, token_symbols: List[str]) -> Dict[str, float]:
         """
-        Get token price from CoinGecko
+        Get token prices from CoinGecko in a single request
+        
+        The CoinGecko client is synchronous (and sleeps to respect its rate
+        limit), so it runs in a worker thread to keep the event loop free.
         
         Args:
-            token_symbol: Token symbol
+            token_symbols: Token symbols
             
         Returns:
-            Token price in USD
+            Dictionary mapping upper-case token symbols to USD prices
         """
         try:
-            return coingecko_utils.get_token_price(token_symbol)
+            return await asyncio.to_thread(coingecko_utils.get_multiple_token_prices, token_symbols)
         except Exception as e:
-            logger.error(f"Error getting token price for {token_symbol}: {e}")
-            return 0.0
+            logger.error(f"Error getting token prices for {token_symbols}: {e}")
+            return {}
             
     async def _estimate_swap_output(self, from_token: str, to_token: str, amount: float) -> float:
         """
@@ -346,6 +447,12 @@ class ExecutionAgent:
         Returns:
             Estimated output amount
         """
+        # Quantize to 4 significant figures so near-identical amounts share an entry
+        key = (from_token, to_token, float(f"{amount:.4g}"))
+        cached = self._swap_estimate_cache.get(key)
+        if cached and time.monotonic() - cached[1] < self.swap_estimate_ttl:
+            return cached[0]
+            
         try:
             from raydium_client import get_client as get_raydium_client
             raydium_client = get_raydium_client()
@@ -353,7 +460,12 @@ class ExecutionAgent:
             simulation = await raydium_client.simulate_swap(from_token, to_token, amount)
             
             if simulation.get("success", False):
-                return simulation.get("expectedOutput", 0.0)
+                expected_output = simulation.get("expectedOutput", 0.0)
+                if len(self._swap_estimate_cache) >= self.swap_estimate_cache_size:
+                    # Drop the oldest entry
+                    self._swap_estimate_cache.pop(next(iter(self._swap_estimate_cache)))
+                self._swap_estimate_cache[key] = (expected_output, time.monotonic())
+                return expected_output
             else:
                 logger.error(f"Swap simulation failed: {simulation.get('error', 'Unknown error')}")
                 return 0.0
@@ -384,30 +496,31 @@ class ExecutionAgent:
         # Use default slippage if not provided
         slippage = slippage if slippage is not None else self.default_slippage
         
-        # Get wallet address
-        wallet_address = await self.get_wallet_address(user_id)
-        
-        if not wallet_address:
-            return {
-                "success": False,
-                "error": "No wallet connected. Please connect a wallet using /walletconnect"
-            }
-            
-        # Get pool data
-        pool_data_result = await self.get_pool_data(pool_id)
-        
-        if not pool_data_result.get("success", False):
-            return pool_data_result
-            
-        pool_data = pool_data_result["pool"]
+        # Look up the wallet balances and the pool data concurrently; the
+        # balance check resolves the wallet address itself
+        balance_result, pool_data_result = await asyncio.gather(
+            self.check_token_balances(user_id),
+            self.get_pool_data(pool_id),
+            return_exceptions=True
+        )
         
-        # Get token balances
-        balance_result = await self.check_token_balances(user_id)
+        for result, label in ((balance_result, "checking token balances"), (pool_data_result, "getting pool data")):
+            if isinstance(result, Exception):
+                logger.error(f"Error {label}: {result}")
+                return {
+                    "success": False,
+                    "error": f"Error {label}: {result}"
+                }
         
         if not balance_result.get("success", False):
             return balance_result
             
+        if not pool_data_result.get("success", False):
+            return pool_data_result
+            
+        wallet_address = balance_result["wallet_address"]
         balances = balance_result["balances"]
+        pool_data = pool_data_result["pool"]
         
         # Calculate swap amounts
         swap_result = await self.get_swap_amounts(
@@ -423,53 +536,39 @@ class ExecutionAgent:
             
         # Build transaction
         try:
+            now = datetime.now()
+            
+            # Latest signal for this pool, resolved by the INSERT itself
+            latest_signal_id = _LATEST_SIGNAL_ID_STMT.params(signal_pool_id=pool_id).scalar_subquery()
+            
             # Create a position entry
             position = Position(
                 user_id=user_id,
                 pool_id=pool_id,
-                status=PositionStatus.PENDING.value,
+                status=PositionStatus.PENDING,
                 invested_amount_usd=usd_amount,
                 token_a_amount=swap_result["token_a_to_deposit"],
                 token_b_amount=swap_result["token_b_to_deposit"],
                 current_value_usd=swap_result["total_value_usd"],
                 current_apr=pool_data["apr"],
-                created_at=datetime.now(),
-                updated_at=datetime.now()
+                initial_composite_signal_id=latest_signal_id,
+                created_at=now,
+                updated_at=now
             )
             
+            # Commit before building the transaction so the write lock is not
+            # held across the wallet service calls; metadata is committed below
             db.session.add(position)
             db.session.commit()
             
-            # Get the latest signal for this pool to set as initial signal
-            latest_signal = db.session.query(CompositeSignal) \
-                .filter(CompositeSignal.pool_id == pool_id) \
-                .order_by(CompositeSignal.timestamp.desc()) \
-                .first()
-                
-            if latest_signal:
-                position.initial_composite_signal_id = latest_signal.id
-                db.session.commit()
-            
             # Build the actual transaction
             transaction_data = {
                 "swap_needed": swap_result["swap_needed"],
                 "position_id": position.id
             }
             
-            if swap_result["swap_needed"]:
-                # Add swap instruction
-                swap_ix = await self.wallet_service.build_swap_instruction(
-                    wallet_address,
-                    swap_result["swap_from_token"],
-                    swap_result["swap_to_token"],
-                    swap_result["swap_amount"],
-                    slippage
-                )
-                
-                transaction_data["swap_instruction"] = swap_ix
-                
-            # Add add-liquidity instruction
-            add_liq_ix = await self.wallet_service.build_add_liquidity_instruction(
+            # Add-liquidity instruction, built alongside the swap when one is needed
+            add_liq_coro = self.wallet_service.build_add_liquidity_instruction(
                 wallet_address,
                 pool_id,
                 pool_data["token_a"],
@@ -479,6 +578,22 @@ class ExecutionAgent:
                 slippage
             )
             
+            if swap_result["swap_needed"]:
+                swap_ix, add_liq_ix = await asyncio.gather(
+                    self.wallet_service.build_swap_instruction(
+                        wallet_address,
+                        swap_result["swap_from_token"],
+                        swap_result["swap_to_token"],
+                        swap_result["swap_amount"],
+                        slippage
+                    ),
+                    add_liq_coro
+                )
+                
+                transaction_data["swap_instruction"] = swap_ix
+            else:
+                add_liq_ix = await add_liq_coro
+            
             transaction_data["add_liquidity_instruction"] = add_liq_ix
             
             # Build the complete transaction
@@ -494,7 +609,7 @@ class ExecutionAgent:
             position.position_metadata = {
                 "transaction_data": transaction_data,
                 "serialized_transaction": transaction.get("serialized_transaction", ""),
-                "expires_at": (datetime.now() + timedelta(minutes=30)).isoformat()
+                "expires_at": (now + timedelta(minutes=30)).isoformat()
             }
             db.session.commit()
             
@@ -540,10 +655,7 @@ class ExecutionAgent:
             # Try to find position in database
             position = None
             try:
-                position = db.session.query(Position).filter(
-                    Position.id == position_id,
-                    Position.user_id == user_id
-                ).first()
+                position = self._get_user_position(user_id, position_id)
             except Exception:
                 pass
                 
@@ -669,6 +781,23 @@ class ExecutionAgent:
                 "error": f"Error exiting position: {e}"
             }
     
+    def _get_user_position(self, user_id: int, position_id: int) -> Optional[Position]:
+        """
+        Load a position owned by a user (blocking)
+        
+        Args:
+            user_id: Telegram user ID
+            position_id: ID of the position
+            
+        Returns:
+            The position or None if not found
+        """
+        # Primary-key lookup through the identity map, then check ownership
+        position = db.session.get(Position, position_id)
+        if position is None or position.user_id != user_id:
+            return None
+        return position
+        
     async def build_exit_tx(
         self,
         user_id: int,
@@ -689,8 +818,10 @@ class ExecutionAgent:
         # Use default slippage if not provided
         slippage = slippage if slippage is not None else self.default_slippage
         
-        # Get wallet address
+        # Get the wallet address; the position is a primary-key lookup on the
+        # request's session, so it stays on this thread
         wallet_address = await self.get_wallet_address(user_id)
+        position = self._get_user_position(user_id, position_id)
         
         if not wallet_address:
             return {
@@ -698,12 +829,6 @@ class ExecutionAgent:
                 "error": "No wallet connected. Please connect a wallet using /walletconnect"
             }
             
-        # Get position data
-        position = db.session.query(Position).filter(
-            Position.id == position_id,
-            Position.user_id == user_id
-        ).first()
-        
         if not position:
             return {
                 "success": False,
@@ -711,10 +836,10 @@ class ExecutionAgent:
             }
             
         # Check position status
-        if position.status not in [PositionStatus.ACTIVE.value, PositionStatus.MONITORED.value]:
+        if position.status not in _EXITABLE_STATUSES:
             return {
                 "success": False,
-                "error": f"Position cannot be exited in status: {position.status}"
+                "error": f"Position cannot be exited in status: {position.status.value}"
             }
             
         # Get pool data
@@ -727,19 +852,22 @@ class ExecutionAgent:
         
         # Build transaction
         try:
+            now = datetime.now()
+            
             # Mark position as exiting
-            position.status = PositionStatus.EXITING.value
-            position.updated_at = datetime.now()
+            position.status = PositionStatus.EXITING
+            position.updated_at = now
             
             # Get the latest signal for this pool to set as exit signal
-            latest_signal = db.session.query(CompositeSignal) \
-                .filter(CompositeSignal.pool_id == position.pool_id) \
-                .order_by(CompositeSignal.timestamp.desc()) \
-                .first()
+            latest_signal_id = db.session.execute(
+                _LATEST_SIGNAL_ID_STMT, {"signal_pool_id": position.pool_id}
+            ).scalar_one_or_none()
                 
-            if latest_signal:
-                position.exit_composite_signal_id = latest_signal.id
+            if latest_signal_id is not None:
+                position.exit_composite_signal_id = latest_signal_id
             
+            # Commit EXITING before the wallet service calls: it guards against a
+            # second exit of this position, and the write lock is released
             db.session.commit()
             
             # Build the actual transaction
@@ -763,18 +891,17 @@ class ExecutionAgent:
                 [transaction_data["remove_liquidity_instruction"]]
             )
             
-            # Store transaction data with the position
-            updated_metadata = {}
-            if position.position_metadata:
-                updated_metadata = position.position_metadata.copy()
-            
-            updated_metadata.update({
+            # Store transaction data with the position (updated in place,
+            # the mutable column marks it dirty)
+            exit_metadata = {
                 "exit_transaction_data": transaction_data,
                 "exit_serialized_transaction": transaction.get("serialized_transaction", ""),
-                "exit_expires_at": (datetime.now() + timedelta(minutes=30)).isoformat()
-            })
-            
-            position.position_metadata = updated_metadata
+                "exit_expires_at": (now + timedelta(minutes=30)).isoformat()
+            }
+            if position.position_metadata is None:
+                position.position_metadata = exit_metadata
+            else:
+                position.position_metadata.update(exit_metadata)
             db.session.commit()
             
             return {
@@ -914,44 +1041,35 @@ class ExecutionAgent:
         Returns:
             Dictionary with transaction result
         """
+        now = datetime.now()
+        
         try:
-            # Submit the transaction
+            # Load the position inline (a primary-key lookup on this thread's
+            # session), then submit the transaction
+            position = self._get_user_position(user_id, position_id) if position_id else None
             result = await self.wallet_service.submit_transaction(transaction_signature)
             
             if not result.get("success", False):
-                if position_id:
-                    # Mark position as failed
-                    position = db.session.query(Position).filter(
-                        Position.id == position_id,
-                        Position.user_id == user_id
-                    ).first()
-                    
-                    if position:
-                        position.status = PositionStatus.FAILED.value
-                        position.updated_at = datetime.now()
-                        db.session.commit()
+                # Mark position as failed
+                if position:
+                    position.status = PositionStatus.FAILED
+                    position.updated_at = now
+                    db.session.commit()
                 
                 return result
                 
-            # Transaction was successful
-            if position_id:
-                # Update position status
-                position = db.session.query(Position).filter(
-                    Position.id == position_id,
-                    Position.user_id == user_id
-                ).first()
-                
-                if position:
-                    if is_exit:
-                        position.status = PositionStatus.COMPLETED.value
-                        position.exited_at = datetime.now()
-                        position.exit_tx_signature = result.get("signature")
-                    else:
-                        position.status = PositionStatus.ACTIVE.value
-                        position.deposit_tx_signature = result.get("signature")
-                        
-                    position.updated_at = datetime.now()
-                    db.session.commit()
+            # Transaction was successful, update position status
+            if position:
+                if is_exit:
+                    position.status = PositionStatus.COMPLETED
+                    position.exited_at = now
+                    position.exit_tx_signature = result.get("signature")
+                else:
+                    position.status = PositionStatus.ACTIVE
+                    position.deposit_tx_signature = result.get("signature")
+                    
+                position.updated_at = now
+                db.session.commit()
             
             return result
             
@@ -961,14 +1079,11 @@ class ExecutionAgent:
             if position_id:
                 # Mark position as failed
                 try:
-                    position = db.session.query(Position).filter(
-                        Position.id == position_id,
-                        Position.user_id == user_id
-                    ).first()
+                    position = self._get_user_position(user_id, position_id)
                     
                     if position:
-                        position.status = PositionStatus.FAILED.value
-                        position.updated_at = datetime.now()
+                        position.status = PositionStatus.FAILED
+                        position.updated_at = now
                         db.session.commit()
                 except Exception:
                     pass
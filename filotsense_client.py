@@ -14,7 +14,20 @@ import asyncio
 from typing import Dict, List, Any, Optional, Tuple
 
 import aiohttp
-from functools import lru_cache
+
+# orjson parses and serializes several times faster; fall back to the
+# standard library when it is not installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+from async_cache import async_ttl_cache
 
 # Import mock data functions for fallback when API is unavailable
 from api_mock_data import (
@@ -25,13 +38,39 @@ from api_mock_data import (
     get_mock_token_sentiment_history
 )
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(name)s: %(message)s')
 logger = logging.getLogger('filotsense_client')
 
 # Flag to control when to use mock data
 USE_MOCK_DATA = os.environ.get("USE_MOCK_DATA", "true").lower() in ("true", "1", "yes")
 
+# How long successful responses are reused, in seconds
+SENTIMENT_CACHE_TTL = 60
+PRICES_CACHE_TTL = 60
+TOPICS_CACHE_TTL = 3600
+REALDATA_CACHE_TTL = 60
+
+# Number of ETag-validated GET responses kept for conditional requests
+ETAG_CACHE_SIZE = 64
+
+def _is_cacheable(response: Dict[str, Any]) -> bool:
+    """Only keep successful responses; errors should be retried on the next call."""
+    return "error" not in response
+
+def _symbols_key(symbols: Optional[List[str]]) -> Optional[str]:
+    """
+    Build the comma-separated symbols parameter, which also serves as the cache key.
+    
+    Symbols are sorted so the same set in a different order hits the same
+    cache entry.
+    
+    Args:
+        symbols: Optional list of token symbols
+        
+    Returns:
+        Comma-separated symbols, or None when no symbols are given
+    """
+    return ",".join(sorted(symbols)) if symbols else None
+
 # Singleton instance
 _instance = None
 
@@ -42,7 +81,7 @@ def get_client() -> 'FiLotSenseClient':
         try:
             _instance = FiLotSenseClient()
         except Exception as e:
-            logger.error(f"Failed to initialize FiLotSenseClient: {e}")
+            logger.error("Failed to initialize FiLotSenseClient: %s", e)
             raise
     return _instance
 
@@ -59,20 +98,47 @@ class FiLotSenseClient:
         # Current rate limits: 100 requests per hour
         self.rate_limit = 100
         self.rate_limit_window = 3600  # 1 hour in seconds
-        self.request_timestamps = []
+        
+        # Adaptive token bucket: starts full and refills at self._rate, which
+        # grows additively on success and shrinks multiplicatively on 429/5xx
+        self._tokens = float(self.rate_limit)
+        self._max_rate = self.rate_limit / self.rate_limit_window  # tokens per second
+        self._min_rate = self._max_rate / 16
+        self._rate = self._max_rate
+        self._alpha = 0.5  # fraction of the max rate added back per success
+        self._beta = 2  # divisor applied to the rate on 429/5xx
+        self._last_refill = time.monotonic()
         
         # Track API health
         self.api_healthy = False
         self.last_health_check = 0
         self.health_check_interval = 300  # Check health every 5 minutes
         
+        # ETag and body of the last successful GET per URL and params, used to
+        # revalidate with If-None-Match once the TTL caches expire
+        self._etags: Dict[Tuple[str, Any], Tuple[str, Dict[str, Any]]] = {}
+        
         # aiohttp session
         self._session = None
 
     async def ensure_session(self) -> aiohttp.ClientSession:
-        """Ensure an aiohttp session exists for making requests."""
+        """
+        Ensure an aiohttp session exists for making requests.
+        
+        The session keeps connections to the API host alive and caches its
+        DNS lookup, so only the first request pays for the TLS handshake.
+        """
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            connector = aiohttp.TCPConnector(
+                limit_per_host=20,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=10),
+                headers={"Accept-Encoding": "gzip, deflate"}
+            )
         return self._session
 
     async def close(self) -> None:
@@ -83,27 +149,43 @@ class FiLotSenseClient:
 
     def _check_rate_limit(self) -> Tuple[bool, Optional[float]]:
         """
-        Check if we're within rate limits.
+        Take a token from the bucket, reserving a future one if it is empty.
+        
+        The token is always consumed, so a caller that is told to wait can
+        send its request after sleeping without checking again. Reservations
+        drive the balance negative, which queues concurrent callers one
+        refill interval apart.
         
         Returns:
             Tuple of (is_allowed, wait_time)
-            where is_allowed is True if request can proceed
-            and wait_time is seconds to wait if not allowed (None if allowed)
+            where is_allowed is True if request can proceed now
+            and wait_time is seconds to wait before sending (None if allowed)
         """
-        current_time = time.time()
-        
-        # Remove timestamps older than the rate limit window
-        self.request_timestamps = [ts for ts in self.request_timestamps 
-                                 if current_time - ts < self.rate_limit_window]
-        
-        # Check if we've reached the rate limit
-        if len(self.request_timestamps) >= self.rate_limit:
-            # Calculate time until oldest request expires
-            oldest = min(self.request_timestamps)
-            wait_time = oldest + self.rate_limit_window - current_time
-            return False, max(0, wait_time)
+        now = time.monotonic()
+        self._tokens = min(self.rate_limit, self._tokens + (now - self._last_refill) * self._rate)
+        self._last_refill = now
+        self._tokens -= 1
+        
+        if self._tokens >= 0:
+            return True, None
             
-        return True, None
+        # Time until the reserved token has been refilled
+        return False, -self._tokens / self._rate
+
+    def _increase_rate(self) -> None:
+        """Additively raise the refill rate after a successful response."""
+        self._rate = min(self._max_rate, self._rate + self._alpha * self._max_rate)
+
+    def _decrease_rate(self, drain: bool = False) -> None:
+        """
+        Multiplicatively lower the refill rate after a 429 or server error.
+        
+        Args:
+            drain: Also empty the bucket so the next request waits for a refill
+        """
+        self._rate = max(self._min_rate, self._rate / self._beta)
+        if drain:
+            self._tokens = min(self._tokens, 0.0)  # keep outstanding reservations
     
     async def _handle_html_response(self, response: aiohttp.ClientResponse, endpoint: str) -> Dict[str, Any]:
         """
@@ -117,7 +199,7 @@ class FiLotSenseClient:
             Extracted data if possible, error dict otherwise
         """
         text = await response.text()
-        logger.warning(f"Received HTML instead of JSON from API. Endpoint: {endpoint}")
+        logger.warning("Received HTML instead of JSON from API. Endpoint: %s", endpoint)
         
         # Special case for health endpoint
         if endpoint == "/health" and ('online' in text.lower() or 'success' in text.lower()):
@@ -131,7 +213,7 @@ class FiLotSenseClient:
                 end_idx = text.rfind('}') + 1
                 if start_idx >= 0 and end_idx > start_idx:
                     json_str = text[start_idx:end_idx]
-                    logger.info(f"Attempting to extract JSON from HTML")
+                    logger.info("Attempting to extract JSON from HTML")
                     return json.loads(json_str)
         except json.JSONDecodeError:
             logger.warning("Could not extract valid JSON from HTML response")
@@ -153,103 +235,103 @@ class FiLotSenseClient:
         retries = 0
         backoff_factor = 2
         
+        # Serialize the body once, not on every retry
+        payload = None
+        headers = None
+        if data is not None:
+            payload = _json_dumps(data)
+            headers = {"Content-Type": "application/json"}
+        
+        # Conditional GET: a 304 lets us reuse the body we already have
+        etag_key = None
+        if method.upper() == 'GET':
+            etag_key = (url, tuple(sorted(params.items())) if params else None)
+            cached = self._etags.get(etag_key)
+            if cached is not None:
+                headers = {**(headers or {}), "If-None-Match": cached[0]}
+        
         while retries < max_retries:
-            # Check rate limits before making request
+            # Take a token before each attempt, waiting for it if the bucket is empty
             is_allowed, wait_time = self._check_rate_limit()
-            if not is_allowed and wait_time is not None:
-                logger.warning(f"Rate limit exceeded. Waiting {wait_time:.2f} seconds before retry.")
+            if not is_allowed:
+                logger.warning("Rate limit exceeded. Waiting %.2f seconds before request.", wait_time)
                 await asyncio.sleep(wait_time)
-                continue
                 
             try:
-                # Record this request timestamp for rate limiting
-                self.request_timestamps.append(time.time())
-                
-                if method.upper() == 'GET':
-                    async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                        if response.status == 429:  # Rate limit exceeded
-                            retry_after = int(response.headers.get('Retry-After', backoff_factor ** retries))
-                            logger.warning(f"Rate limit exceeded. Retrying after {retry_after} seconds.")
-                            await asyncio.sleep(retry_after)
-                            retries += 1
-                            continue
-                        
-                        if response.status >= 500:  # Server error
-                            logger.warning(f"Server error {response.status}. Retrying after {backoff_factor ** retries} seconds.")
-                            await asyncio.sleep(backoff_factor ** retries)
-                            retries += 1
-                            continue
-                            
-                        if response.status != 200:
-                            error_text = await response.text()
-                            logger.error(f"API error {response.status}: {error_text}")
-                            return {"error": f"API error {response.status}", "details": error_text}
+                async with session.request(method.upper(), url, params=params, data=payload, headers=headers) as response:
+                    if response.status == 304 and etag_key in self._etags:  # Not modified
+                        self._increase_rate()
+                        return self._etags[etag_key][1]
+                    
+                    if response.status == 429:  # Rate limit exceeded
+                        self._decrease_rate(drain=True)
+                        retry_after = response.headers.get('Retry-After')
+                        if retry_after is not None:
+                            logger.warning("Rate limit exceeded. Retrying after %s seconds.", retry_after)
+                            await asyncio.sleep(int(retry_after))
+                        else:
+                            logger.warning("Rate limit exceeded. Slowing request rate to %.4f/s.", self._rate)
+                        retries += 1
+                        continue
+                    
+                    if response.status >= 500:  # Server error
+                        self._decrease_rate()
+                        logger.warning("Server error %s. Slowing request rate to %.4f/s.", response.status, self._rate)
+                        retries += 1
+                        continue
                         
-                        # Check content type for HTML instead of JSON
-                        content_type = response.headers.get('Content-Type', '')
-                        if 'text/html' in content_type:
-                            return await self._handle_html_response(response, endpoint)
-                            
-                        try:
-                            return await response.json()
-                        except json.JSONDecodeError as e:
-                            text = await response.text()
-                            logger.error(f"Failed to decode JSON response: {e}. Response text: {text[:200]}")
-                            
-                            # Try to extract JSON if embedded in HTML
-                            return await self._handle_html_response(response, endpoint)
-                else:  # POST, PUT, etc.
-                    async with session.request(method, url, params=params, json=data, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                        if response.status == 429:  # Rate limit exceeded
-                            retry_after = int(response.headers.get('Retry-After', backoff_factor ** retries))
-                            logger.warning(f"Rate limit exceeded. Retrying after {retry_after} seconds.")
-                            await asyncio.sleep(retry_after)
-                            retries += 1
-                            continue
+                    if response.status != 200:
+                        error_text = await response.text()
+                        logger.error("API error %s: %s", response.status, error_text)
+                        return {"error": f"API error {response.status}", "details": error_text}
+                    
+                    self._increase_rate()
+                    
+                    if logger.isEnabledFor(logging.DEBUG):
+                        # The body is decompressed transparently; compare it with the wire size
+                        body = await response.read()
+                        logger.debug(
+                            "%s: %s bytes received (%s), %d bytes decoded",
+                            endpoint, response.content_length,
+                            response.headers.get('Content-Encoding', 'identity'), len(body)
+                        )
+                    
+                    # Check content type for HTML instead of JSON
+                    content_type = response.headers.get('Content-Type', '')
+                    if 'text/html' in content_type:
+                        return await self._handle_html_response(response, endpoint)
+                    
+                    try:
+                        result = await response.json(loads=_json_loads)
+                    except json.JSONDecodeError as e:
+                        text = await response.text()
+                        logger.error("Failed to decode JSON response: %s. Response text: %s", e, text[:200])
                         
-                        if response.status >= 500:  # Server error
-                            logger.warning(f"Server error {response.status}. Retrying after {backoff_factor ** retries} seconds.")
-                            await asyncio.sleep(backoff_factor ** retries)
-                            retries += 1
-                            continue
-                            
-                        if response.status != 200:
-                            error_text = await response.text()
-                            logger.error(f"API error {response.status}: {error_text}")
-                            return {"error": f"API error {response.status}", "details": error_text}
-                        
-                        # Check content type for HTML instead of JSON
-                        content_type = response.headers.get('Content-Type', '')
-                        if 'text/html' in content_type:
-                            return await self._handle_html_response(response, endpoint)
-                            
-                        try:
-                            return await response.json()
-                        except json.JSONDecodeError as e:
-                            text = await response.text()
-                            logger.error(f"Failed to decode JSON response: {e}. Response text: {text[:200]}")
-                            
-                            # Try to extract JSON if embedded in HTML
-                            return await self._handle_html_response(response, endpoint)
-            
+                        # Try to extract JSON if embedded in HTML
+                        return await self._handle_html_response(response, endpoint)
+                    
+                    etag = response.headers.get('ETag')
+                    if etag_key is not None and etag and isinstance(result, dict):
+                        self._etags.pop(etag_key, None)
+                        self._etags[etag_key] = (etag, result)
+                        if len(self._etags) > ETAG_CACHE_SIZE:
+                            del self._etags[next(iter(self._etags))]
+                    return result
+        
             except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-                logger.warning(f"Request failed: {e}. Retrying ({retries+1}/{max_retries})")
+                logger.warning("Request failed: %s. Retrying (%s/%s)", e, retries + 1, max_retries)
                 await asyncio.sleep(backoff_factor ** retries)
                 retries += 1
         
-        logger.error(f"Failed to make request after {max_retries} retries")
+        logger.error("Failed to make request after %s retries", max_retries)
         return {"error": "Maximum retries exceeded"}
 
     # Cached sentiment fetch to minimize API calls
-    @lru_cache(maxsize=8)
-    async def _fetch_sentiment_simple_cached(self, symbols: Optional[str], timestamp: int) -> Dict[str, Any]:
+    @async_ttl_cache(ttl=SENTIMENT_CACHE_TTL, maxsize=8, cache_if=_is_cacheable)
+    async def _fetch_sentiment_simple_cached(self, symbols: Optional[str]) -> Dict[str, Any]:
         """Cached version of fetch_sentiment_simple to minimize API calls."""
         endpoint = "/sentiment/simple"
-        params = {}
-        
-        if symbols:
-            params["symbols"] = symbols
-        
+        params = {"symbols": symbols} if symbols else None
         return await self._make_request(endpoint, params=params)
 
     async def fetch_sentiment_simple(self, symbols: Optional[List[str]] = None) -> Dict[str, float]:
@@ -267,17 +349,11 @@ class FiLotSenseClient:
             logger.info("Using mock data for fetch_sentiment_simple")
             return get_mock_sentiment_simple(symbols)
         
-        symbols_str = None
-        if symbols:
-            symbols_str = ",".join(symbols)
-        
-        # Round to nearest minute to improve cache hits
-        timestamp = int(time.time()) // 60
-        
-        response = await self._fetch_sentiment_simple_cached(symbols_str, timestamp)
+        symbols_key = _symbols_key(symbols)
+        response = await self._fetch_sentiment_simple_cached(symbols_key)
         
         if "error" in response:
-            logger.error(f"Error fetching simple sentiment: {response['error']}")
+            logger.error("Error fetching simple sentiment: %s", response['error'])
             logger.info("Falling back to mock data for fetch_sentiment_simple due to API error")
             return get_mock_sentiment_simple(symbols)
             
@@ -305,22 +381,18 @@ class FiLotSenseClient:
                 return get_mock_sentiment_simple(symbols)
                 
         except Exception as e:
-            logger.error(f"Error processing sentiment data: {e}")
+            logger.error("Error processing sentiment data: %s", e)
             logger.info("Falling back to mock data for fetch_sentiment_simple due to processing error")
             return get_mock_sentiment_simple(symbols)
             
         return sentiment_data
 
     # Cached prices fetch to minimize API calls
-    @lru_cache(maxsize=8)
-    async def _fetch_prices_latest_cached(self, symbols: Optional[str], timestamp: int) -> Dict[str, Any]:
+    @async_ttl_cache(ttl=PRICES_CACHE_TTL, maxsize=8, cache_if=_is_cacheable)
+    async def _fetch_prices_latest_cached(self, symbols: Optional[str]) -> Dict[str, Any]:
         """Cached version of fetch_prices_latest to minimize API calls."""
         endpoint = "/prices/latest"
-        params = {}
-        
-        if symbols:
-            params["symbols"] = symbols
-        
+        params = {"symbols": symbols} if symbols else None
         return await self._make_request(endpoint, params=params)
 
     async def fetch_prices_latest(self, symbols: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
@@ -338,17 +410,11 @@ class FiLotSenseClient:
             logger.info("Using mock data for fetch_prices_latest")
             return get_mock_prices_latest(symbols)
         
-        symbols_str = None
-        if symbols:
-            symbols_str = ",".join(symbols)
-        
-        # Round to nearest minute to improve cache hits
-        timestamp = int(time.time()) // 60
-        
-        response = await self._fetch_prices_latest_cached(symbols_str, timestamp)
+        symbols_key = _symbols_key(symbols)
+        response = await self._fetch_prices_latest_cached(symbols_key)
         
         if "error" in response:
-            logger.error(f"Error fetching latest prices: {response['error']}")
+            logger.error("Error fetching latest prices: %s", response['error'])
             logger.info("Falling back to mock data for fetch_prices_latest due to API error")
             return get_mock_prices_latest(symbols)
             
@@ -368,15 +434,15 @@ class FiLotSenseClient:
                 return get_mock_prices_latest(symbols)
                 
         except Exception as e:
-            logger.error(f"Error processing price data: {e}")
+            logger.error("Error processing price data: %s", e)
             logger.info("Falling back to mock data for fetch_prices_latest due to processing error")
             return get_mock_prices_latest(symbols)
             
         return price_data
 
     # Cached sentiment topics fetch to minimize API calls
-    @lru_cache(maxsize=4)
-    async def _fetch_sentiment_topics_cached(self, timestamp: int) -> Dict[str, Any]:
+    @async_ttl_cache(ttl=TOPICS_CACHE_TTL, maxsize=4, cache_if=_is_cacheable)
+    async def _fetch_sentiment_topics_cached(self) -> Dict[str, Any]:
         """Cached version of fetch_sentiment_topics to minimize API calls."""
         endpoint = "/sentiment/topics"
         return await self._make_request(endpoint)
@@ -393,13 +459,10 @@ class FiLotSenseClient:
             logger.info("Using mock data for fetch_sentiment_topics")
             return get_mock_sentiment_topics()
         
-        # Round to nearest hour to improve cache hits
-        timestamp = int(time.time()) // 3600
-        
-        response = await self._fetch_sentiment_topics_cached(timestamp)
+        response = await self._fetch_sentiment_topics_cached()
         
         if "error" in response:
-            logger.error(f"Error fetching sentiment topics: {response['error']}")
+            logger.error("Error fetching sentiment topics: %s", response['error'])
             logger.info("Falling back to mock data for fetch_sentiment_topics due to API error")
             return get_mock_sentiment_topics()
             
@@ -422,22 +485,18 @@ class FiLotSenseClient:
                 return get_mock_sentiment_topics()
                 
         except Exception as e:
-            logger.error(f"Error processing sentiment topics: {e}")
+            logger.error("Error processing sentiment topics: %s", e)
             logger.info("Falling back to mock data for fetch_sentiment_topics due to processing error")
             return get_mock_sentiment_topics()
             
         return topics
 
     # Cached realdata fetch to minimize API calls
-    @lru_cache(maxsize=8)
-    async def _fetch_realdata_cached(self, symbols: Optional[str], timestamp: int) -> Dict[str, Any]:
+    @async_ttl_cache(ttl=REALDATA_CACHE_TTL, maxsize=8, cache_if=_is_cacheable)
+    async def _fetch_realdata_cached(self, symbols: Optional[str]) -> Dict[str, Any]:
         """Cached version of fetch_realdata to minimize API calls."""
         endpoint = "/realdata"
-        params = {}
-        
-        if symbols:
-            params["symbols"] = symbols
-        
+        params = {"symbols": symbols} if symbols else None
         return await self._make_request(endpoint, params=params)
 
     async def fetch_realdata(self, symbols: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
@@ -455,17 +514,11 @@ class FiLotSenseClient:
             logger.info("Using mock data for fetch_realdata")
             return get_mock_realdata(symbols)
         
-        symbols_str = None
-        if symbols:
-            symbols_str = ",".join(symbols)
-        
-        # Round to nearest minute to improve cache hits
-        timestamp = int(time.time()) // 60
-        
-        response = await self._fetch_realdata_cached(symbols_str, timestamp)
+        symbols_key = _symbols_key(symbols)
+        response = await self._fetch_realdata_cached(symbols_key)
         
         if "error" in response:
-            logger.error(f"Error fetching real-time data: {response['error']}")
+            logger.error("Error fetching real-time data: %s", response['error'])
             logger.info("Falling back to mock data for fetch_realdata due to API error")
             return get_mock_realdata(symbols)
             
@@ -485,12 +538,44 @@ class FiLotSenseClient:
                 return get_mock_realdata(symbols)
                 
         except Exception as e:
-            logger.error(f"Error processing real-time data: {e}")
+            logger.error("Error processing real-time data: %s", e)
             logger.info("Falling back to mock data for fetch_realdata due to processing error")
             return get_mock_realdata(symbols)
             
         return realdata
 
+    async def fetch_dashboard(self, symbols: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch sentiment, prices and real-time data for a set of tokens concurrently.
+        
+        Args:
+            symbols: Optional list of token symbols to get data for
+            
+        Returns:
+            Dictionary with "sentiment", "prices" and "realdata" keys holding the
+            results of the corresponding fetch methods; a section whose fetch
+            raised is returned empty
+        """
+        # Settle the API health once up front; otherwise the concurrent fetches
+        # race on check_health and the later ones see the unset default
+        await self.check_health()
+        
+        sections = ("sentiment", "prices", "realdata")
+        results = await asyncio.gather(
+            self.fetch_sentiment_simple(symbols),
+            self.fetch_prices_latest(symbols),
+            self.fetch_realdata(symbols),
+            return_exceptions=True
+        )
+        
+        dashboard = {}
+        for section, result in zip(sections, results):
+            if isinstance(result, Exception):
+                logger.error("Error fetching %s for dashboard: %s", section, result)
+                result = {}
+            dashboard[section] = result
+        return dashboard
+
     async def fetch_token_sentiment_history(self, symbol: str, days: int = 7) -> List[Dict[str, Any]]:
         """
         Fetch historical sentiment data for a specific token.
@@ -513,7 +598,7 @@ class FiLotSenseClient:
         response = await self._make_request(endpoint, params=params)
         
         if "error" in response:
-            logger.error(f"Error fetching sentiment history: {response['error']}")
+            logger.error("Error fetching sentiment history: %s", response['error'])
             logger.info("Falling back to mock data for fetch_token_sentiment_history due to API error")
             return get_mock_token_sentiment_history(symbol, days)
             
@@ -531,7 +616,7 @@ class FiLotSenseClient:
             return get_mock_token_sentiment_history(symbol, days)
                 
         except Exception as e:
-            logger.error(f"Error in fetch_token_sentiment_history: {e}")
+            logger.error("Error in fetch_token_sentiment_history: %s", e)
             logger.info("Falling back to mock data for fetch_token_sentiment_history due to processing error")
             return get_mock_token_sentiment_history(symbol, days)
             
@@ -539,22 +624,28 @@ class FiLotSenseClient:
         """
         Check if the FiLotSense API is healthy and accessible.
         
+        Sends a HEAD request with a short timeout directly on the session,
+        so health checks neither retry nor spend rate-limit tokens.
+        
         Returns:
             True if the API is healthy, False otherwise
         """
         # Only check health periodically to avoid excessive API calls
-        current_time = time.time()
+        current_time = time.monotonic()
         if current_time - self.last_health_check < self.health_check_interval and self.last_health_check > 0:
             return self.api_healthy
             
         self.last_health_check = current_time
         
         try:
-            response = await self._make_request("/health")
-            status = response.get("status", "").lower()
-            self.api_healthy = status in ["success", "online", "ok"]
+            session = await self.ensure_session()
+            async with session.head(
+                f"{self.base_url}/health",
+                timeout=aiohttp.ClientTimeout(total=1)
+            ) as response:
+                self.api_healthy = response.status < 500
             return self.api_healthy
         except Exception as e:
-            logger.error(f"API health check failed: {e}")
+            logger.error("API health check failed: %s", e)
             self.api_healthy = False
             return False
\ No newline at end of file
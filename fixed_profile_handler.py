@@ -6,23 +6,131 @@ the high-risk and stable profile buttons.
 """
 
 import logging
-import traceback
+import os
+import queue
+import sqlite3
 import time
+from contextlib import contextmanager
 from typing import Dict, Any, Optional, List, Tuple
 import json
-from sqlalchemy.exc import NoResultFound
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(name)s: %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 # Keep track of profile setting attempts to prevent rapid clicking
 profile_attempts = {}  # {user_id: last_attempt_time}
 PROFILE_ATTEMPT_THRESHOLD = 2.0  # seconds
 
+# Accepted profile values, with or without the callback "profile_" prefix
+_CALLBACK_TO_PROFILE = {
+    "high-risk": "high-risk",
+    "profile_high-risk": "high-risk",
+    "stable": "stable",
+    "profile_stable": "stable",
+}
+
+# User-facing text for each profile type
+_MESSAGES = {
+    "high-risk": "✅ Your profile has been set to High Risk.\n\nThis profile focuses on pools with potentially higher returns but may have higher volatility. You'll receive recommendations for pools with higher APR but potentially more risk.",
+    "stable": "✅ Your profile has been set to Stable.\n\nThis profile focuses on more established pools with potentially lower but more consistent returns. You'll receive recommendations for pools with moderate APR but higher stability.",
+}
+_ERROR_MESSAGES = {
+    "high-risk": "Sorry, there was an error setting your profile to High Risk. Please try again in a moment.",
+    "stable": "Sorry, there was an error setting your profile to Stable. Please try again in a moment.",
+}
+
+# Fixed response fields per profile type; callers add chat_id (and error)
+_SUCCESS_RESPONSES = {
+    profile: {"success": True, "action": "profile_set", "profile": profile, "message": message}
+    for profile, message in _MESSAGES.items()
+}
+_ERROR_RESPONSES = {
+    profile: {"success": False, "action": "error", "message": message}
+    for profile, message in _ERROR_MESSAGES.items()
+}
+
+# SQLite database shared with the Flask app, resolved once at import
+DB_PATH = os.path.abspath(os.environ.get(
+    "FILOT_DB_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "filot_bot.db")
+))
+
+# Per-connection tuning; WAL itself is persisted in the database file
+_CONNECTION_PRAGMAS = """
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-20000;
+"""
+_wal_enabled = False
+
+# Pre-opened connections reused across profile writes to keep the page cache warm
+POOL_SIZE = 4
+_POOL: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=POOL_SIZE)
+
+# users.id is the primary key (models.User), so the conflict target and the
+# lookup are served by its unique index; no extra index is needed
+_UPSERT_PROFILE_SQL = """
+INSERT INTO users (id, risk_profile, created_at, last_active)
+VALUES (?, ?, datetime('now'), datetime('now'))
+ON CONFLICT(id) DO UPDATE SET
+    risk_profile = excluded.risk_profile,
+    last_active = datetime('now')
+"""
+
+def _connect() -> sqlite3.Connection:
+    """
+    Open a tuned connection to the bot database.
+    
+    Returns:
+        The open connection
+    """
+    global _wal_enabled
+    # Autocommit mode; writers open their own BEGIN IMMEDIATE transaction
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None)
+    if not _wal_enabled and DB_PATH != ":memory:":
+        conn.execute("PRAGMA journal_mode=WAL")
+        _wal_enabled = True
+    conn.executescript(_CONNECTION_PRAGMAS)
+    return conn
+
+@contextmanager
+def get_conn():
+    """
+    Borrow a connection from the pool, opening a new one if none is idle.
+    
+    Yields:
+        A tuned database connection, returned to the pool afterwards
+    """
+    try:
+        conn = _POOL.get_nowait()
+    except queue.Empty:
+        conn = _connect()
+    try:
+        yield conn
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        try:
+            _POOL.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+def update_or_create_user(user_id: int, profile_type: str) -> None:
+    """
+    Set a user's risk profile with direct SQL, creating the user if needed.
+    
+    Args:
+        user_id: The Telegram user ID
+        profile_type: The profile type ('high-risk' or 'stable')
+    """
+    with get_conn() as conn:
+        # Take the write lock up front so the upsert cannot hit a lock upgrade
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute(_UPSERT_PROFILE_SQL, (user_id, profile_type))
+        conn.commit()
+    
+    logger.info("Set user %s profile to '%s'", user_id, profile_type)
+
 def handle_profile_setting(user_id: int, chat_id: int, profile_type: str) -> Dict[str, Any]:
     """
     Handle profile setting with enhanced error handling.
@@ -36,7 +144,17 @@ def handle_profile_setting(user_id: int, chat_id: int, profile_type: str) -> Dic
         Dict with response data
     """
     try:
-        logger.info(f"User {user_id} selecting profile: {profile_type}")
+        logger.debug("User %s selecting profile: %s", user_id, profile_type)
+        
+        profile = _CALLBACK_TO_PROFILE.get(profile_type)
+        if profile is None:
+            logger.error("Unknown profile type: %s", profile_type)
+            return {
+                "success": False,
+                "action": "error",
+                "message": "Unknown profile type. Please select either 'High Risk' or 'Stable'.",
+                "chat_id": chat_id
+            }
         
         # Check for rate limiting (prevent rapid clicks)
         current_time = time.time()
@@ -45,7 +163,7 @@ def handle_profile_setting(user_id: int, chat_id: int, profile_type: str) -> Dic
             
             # If clicking too rapidly, throttle
             if time_diff < PROFILE_ATTEMPT_THRESHOLD:
-                logger.warning(f"User {user_id} clicking profile buttons too rapidly ({time_diff:.2f}s)")
+                logger.warning("User %s clicking profile buttons too rapidly (%.2fs)", user_id, time_diff)
                 return {
                     "success": False,
                     "action": "error",
@@ -58,22 +176,10 @@ def handle_profile_setting(user_id: int, chat_id: int, profile_type: str) -> Dic
         profile_attempts[user_id] = current_time
         
         # Handle the profile setting based on type
-        if profile_type == "high-risk":
-            return set_high_risk_profile(user_id, chat_id)
-        elif profile_type == "stable":
-            return set_stable_profile(user_id, chat_id)
-        else:
-            logger.error(f"Unknown profile type: {profile_type}")
-            return {
-                "success": False,
-                "action": "error",
-                "message": "Unknown profile type. Please select either 'High Risk' or 'Stable'.",
-                "chat_id": chat_id
-            }
+        return _PROFILE_SETTERS[profile](user_id, chat_id)
             
     except Exception as e:
-        logger.error(f"Error setting profile: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error setting profile: %s", e)
         
         # Fallback message if something goes wrong
         return {
@@ -84,84 +190,40 @@ def handle_profile_setting(user_id: int, chat_id: int, profile_type: str) -> Dic
             "chat_id": chat_id
         }
 
-def set_high_risk_profile(user_id: int, chat_id: int) -> Dict[str, Any]:
+def _set_profile(user_id: int, chat_id: int, profile_type: str) -> Dict[str, Any]:
     """
-    Set a user's profile to high-risk.
+    Write a normalized profile type and build the response for it.
     
     Args:
         user_id: The Telegram user ID
         chat_id: The Telegram chat ID
+        profile_type: The profile type ('high-risk' or 'stable')
         
     Returns:
         Dict with response data
     """
     try:
-        # Import the database modules
-        from app import db
-        from models import User
-        
-        # Check if the user exists
-        try:
-            user = db.session.query(User).filter_by(telegram_id=user_id).one()
-            old_profile = user.risk_profile
-            
-            # Update the user's profile
-            setattr(user, 'risk_profile', 'high-risk')
-            db.session.commit()
-            
-            logger.info(f"Updated user {user_id} profile from '{old_profile}' to 'high-risk'")
-        except NoResultFound:
-            # Create a new user with the id field (which is the telegram_id)
-            new_user = User(id=user_id)
-            setattr(new_user, 'risk_profile', 'high-risk')
-            db.session.add(new_user)
-            db.session.commit()
-            
-            logger.info(f"Created new user {user_id} with 'high-risk' profile")
-        
-        # Return success response
-        return {
-            "success": True,
-            "action": "profile_set",
-            "profile": "high-risk",
-            "message": "✅ Your profile has been set to High Risk.\n\nThis profile focuses on pools with potentially higher returns but may have higher volatility. You'll receive recommendations for pools with higher APR but potentially more risk.",
-            "chat_id": chat_id
-        }
+        update_or_create_user(user_id, profile_type)
+        return {**_SUCCESS_RESPONSES[profile_type], "chat_id": chat_id}
         
     except Exception as e:
-        logger.error(f"Error setting high-risk profile: {e}")
-        logger.error(traceback.format_exc())
-        
-        # Try an alternative approach if the first one fails
-        try:
-            # Try using a different approach - direct SQL
-            from app import db
-            db.session.execute("UPDATE users SET risk_profile = 'high-risk' WHERE id = :user_id", 
-                              {"user_id": user_id})
-            db.session.commit()
-            
-            logger.info(f"Set user {user_id} profile to 'high-risk' using db_utils")
-            
-            # Return success response
-            return {
-                "success": True,
-                "action": "profile_set",
-                "profile": "high-risk",
-                "message": "✅ Your profile has been set to High Risk.\n\nThis profile focuses on pools with potentially higher returns but may have higher volatility. You'll receive recommendations for pools with higher APR but potentially more risk.",
-                "chat_id": chat_id
-            }
-        except Exception as inner_e:
-            logger.error(f"Alternative approach also failed: {inner_e}")
-            logger.error(traceback.format_exc())
+        logger.exception("Error setting %s profile: %s", profile_type, e)
         
         # Fallback message if something goes wrong
-        return {
-            "success": False,
-            "action": "error",
-            "message": "Sorry, there was an error setting your profile to High Risk. Please try again in a moment.",
-            "error": str(e),
-            "chat_id": chat_id
-        }
+        return {**_ERROR_RESPONSES[profile_type], "error": str(e), "chat_id": chat_id}
+
+def set_high_risk_profile(user_id: int, chat_id: int) -> Dict[str, Any]:
+    """
+    Set a user's profile to high-risk.
+    
+    Args:
+        user_id: The Telegram user ID
+        chat_id: The Telegram chat ID
+        
+    Returns:
+        Dict with response data
+    """
+    return _set_profile(user_id, chat_id, "high-risk")
 
 def set_stable_profile(user_id: int, chat_id: int) -> Dict[str, Any]:
     """
@@ -174,71 +236,13 @@ def set_stable_profile(user_id: int, chat_id: int) -> Dict[str, Any]:
     Returns:
         Dict with response data
     """
-    try:
-        # Import the database modules
-        from app import db
-        from models import User
-        
-        # Check if the user exists
-        try:
-            user = db.session.query(User).filter_by(telegram_id=user_id).one()
-            old_profile = user.risk_profile
-            
-            # Update the user's profile
-            setattr(user, 'risk_profile', 'stable')
-            db.session.commit()
-            
-            logger.info(f"Updated user {user_id} profile from '{old_profile}' to 'stable'")
-        except NoResultFound:
-            # Create a new user with the id field (which is the telegram_id)
-            new_user = User(id=user_id)
-            setattr(new_user, 'risk_profile', 'stable')
-            db.session.add(new_user)
-            db.session.commit()
-            
-            logger.info(f"Created new user {user_id} with 'stable' profile")
-        
-        # Return success response
-        return {
-            "success": True,
-            "action": "profile_set",
-            "profile": "stable",
-            "message": "✅ Your profile has been set to Stable.\n\nThis profile focuses on more established pools with potentially lower but more consistent returns. You'll receive recommendations for pools with moderate APR but higher stability.",
-            "chat_id": chat_id
-        }
-        
-    except Exception as e:
-        logger.error(f"Error setting stable profile: {e}")
-        logger.error(traceback.format_exc())
-        
-        # Try an alternative approach if the first one fails
-        try:
-            # Import database utils directly
-            import db_utils
-            db_utils.set_user_profile(user_id, "stable")
-            
-            logger.info(f"Set user {user_id} profile to 'stable' using db_utils")
-            
-            # Return success response
-            return {
-                "success": True,
-                "action": "profile_set",
-                "profile": "stable",
-                "message": "✅ Your profile has been set to Stable.\n\nThis profile focuses on more established pools with potentially lower but more consistent returns. You'll receive recommendations for pools with moderate APR but higher stability.",
-                "chat_id": chat_id
-            }
-        except Exception as inner_e:
-            logger.error(f"Alternative approach also failed: {inner_e}")
-            logger.error(traceback.format_exc())
-        
-        # Fallback message if something goes wrong
-        return {
-            "success": False,
-            "action": "error",
-            "message": "Sorry, there was an error setting your profile to Stable. Please try again in a moment.",
-            "error": str(e),
-            "chat_id": chat_id
-        }
+    return _set_profile(user_id, chat_id, "stable")
+
+# Setter for each normalized profile type
+_PROFILE_SETTERS = {
+    "high-risk": set_high_risk_profile,
+    "stable": set_stable_profile,
+}
 
 def cleanup_profile_data(max_age: int = 3600) -> None:
     """
@@ -254,4 +258,4 @@ def cleanup_profile_data(max_age: int = 3600) -> None:
         if current_time - timestamp > max_age:
             del profile_attempts[user_id]
             
-    logger.debug(f"Cleaned up profile attempts data, now tracking {len(profile_attempts)} users")
\ No newline at end of file
+    logger.debug("Cleaned up profile attempts data, now tracking %d users", len(profile_attempts))
\ No newline at end of file
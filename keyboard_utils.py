@@ -3,6 +3,8 @@ Persistent keyboard utilities for simplified bot interaction
 Provides a consistent One-Command UX with persistent menu buttons
 """
 
+import json
+
 from telegram import ReplyKeyboardMarkup, ReplyKeyboardRemove, InlineKeyboardButton, InlineKeyboardMarkup
 
 # Main persistent reply keyboard
@@ -19,6 +21,9 @@ MAIN_KEYBOARD_DICT = {
     "one_time_keyboard": False
 }
 
+# Pre-serialized MAIN_KEYBOARD_DICT so senders don't re-encode it per message
+MAIN_KEYBOARD_JSON = json.dumps(MAIN_KEYBOARD_DICT, ensure_ascii=False, separators=(",", ":"))
+
 # Inline version of the main keyboard for embedding in messages
 def get_main_menu_inline() -> InlineKeyboardMarkup:
     """
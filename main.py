@@ -16,7 +16,7 @@ import hashlib
 import json
 import requests
 import sqlite3
-from collections import deque
+from collections import deque, OrderedDict
 from datetime import datetime
 from dotenv import load_dotenv
 
@@ -31,17 +31,18 @@ from telegram.ext import Application, ContextTypes
 # Import keyboard utilities for consistent UI
 from keyboard_utils import MAIN_KEYBOARD
 
-# Global set to track processed messages and prevent duplication
-processed_messages = set()
+# Global LRU of processed message IDs (values unused) to prevent duplication
+processed_messages = OrderedDict()
 # Keep track of only the last 1000 messages to prevent memory leaks
 MAX_PROCESSED_MESSAGES = 1000
-# Dictionary to track recently sent messages to prevent duplicates
-recent_messages = {}
 
 # ANTI-LOOP SYSTEM: Import the aggressive anti-loop protection system
 # This will automatically monkey-patch key functions to prevent message loops
 import anti_loop
 
+# Sliding-window Bloom filter of recently sent messages to prevent duplicates
+recent_messages = anti_loop.SlidingBloomFilter(capacity=MAX_PROCESSED_MESSAGES, window=10.0)
+
 def is_message_processed(chat_id, message_id):
     """
     Check if a message has already been processed and mark it as processed if not.
@@ -53,23 +54,20 @@ def is_message_processed(chat_id, message_id):
     Returns:
         bool: True if the message has already been processed, False otherwise
     """
-    global processed_messages
-    
     # Create a unique tracking ID for this message
     tracking_id = f"{chat_id}_{message_id}"
     
     # Check if we've seen this message before
     if tracking_id in processed_messages:
+        processed_messages.move_to_end(tracking_id)
         return True
         
     # Mark message as processed
-    processed_messages.add(tracking_id)
+    processed_messages[tracking_id] = None
     
-    # Maintain max size for processed_messages
+    # Evict the oldest entry once we exceed the max size
     if len(processed_messages) > MAX_PROCESSED_MESSAGES:
-        # Convert to list, slice, and convert back to set to remove oldest entries
-        processed_messages_list = list(processed_messages)
-        processed_messages = set(processed_messages_list[-MAX_PROCESSED_MESSAGES:])
+        processed_messages.popitem(last=False)
         
     return False
 from telegram import Update
@@ -273,22 +271,15 @@ def run_telegram_bot():
                 def send_response(chat_id, text, parse_mode=None, reply_markup=None, message_id=None):
                     try:
                         # Create a unique identifier for this message to prevent duplicates
-                        msg_hash = f"{chat_id}_{hashlib.md5(text.encode()).hexdigest()[:8]}"
+                        msg_hash = f"{chat_id}_{hashlib.blake2b(text.encode(), digest_size=4).hexdigest()}"
                         
                         # Check if we've already sent a very similar message in the last 10 seconds
-                        now = time.time()
                         if msg_hash in recent_messages:
-                            if now - recent_messages[msg_hash] < 10:
-                                logger.warning(f"Preventing duplicate message: {text[:30]}...")
-                                return
-                        
-                        # Update the recent messages tracker
-                        recent_messages[msg_hash] = now
+                            logger.warning(f"Preventing duplicate message: {text[:30]}...")
+                            return
                         
-                        # Clean up old messages to prevent memory leak
-                        old_msgs = [k for k, v in recent_messages.items() if now - v > 30]
-                        for k in old_msgs:
-                            recent_messages.pop(k, None)
+                        # Update the recent messages tracker (old entries age out on their own)
+                        recent_messages.add(msg_hash)
 
                         params = {
                             "chat_id": chat_id,
@@ -302,7 +293,10 @@ def run_telegram_bot():
                         # for error messages or regular text responses
                         if reply_markup:
                             # Handle different types of reply_markup objects
-                            if hasattr(reply_markup, 'to_dict'):
+                            if isinstance(reply_markup, str):
+                                # Already serialized JSON (e.g. a handler's pre-encoded keyboard)
+                                params["reply_markup"] = reply_markup
+                            elif hasattr(reply_markup, 'to_dict'):
                                 # This is a telegram.ReplyMarkup object (like InlineKeyboardMarkup)
                                 params["reply_markup"] = json.dumps(reply_markup.to_dict())
                             elif isinstance(reply_markup, dict):
@@ -317,11 +311,11 @@ def run_telegram_bot():
                         else:
                             # Import here to avoid circular imports
                             try:
-                                from keyboard_utils import MAIN_KEYBOARD_DICT
+                                from keyboard_utils import MAIN_KEYBOARD_JSON
                                 # Apply the persistent keyboard to all messages without custom markup
-                                params["reply_markup"] = json.dumps(MAIN_KEYBOARD_DICT)
+                                params["reply_markup"] = MAIN_KEYBOARD_JSON
                             except Exception as kb_error:
-                                logger.error(f"Failed to import MAIN_KEYBOARD_DICT: {kb_error}")
+                                logger.error(f"Failed to import MAIN_KEYBOARD_JSON: {kb_error}")
                             
                         # Add message tracking ID if provided
                         if message_id:
@@ -742,7 +736,7 @@ def run_telegram_bot():
                     
                     # Create multiple tracking IDs to robustly prevent duplicate processing
                     query_track_id = f"cb_{query_id}"
-                    data_track_id = f"cb_data_{chat_id}_{hashlib.md5(callback_data.encode()).hexdigest()[:8]}"
+                    data_track_id = f"cb_data_{chat_id}_{hashlib.blake2b(callback_data.encode(), digest_size=4).hexdigest()}"
                     
                     # Special handling for navigation buttons to allow them to be pressed multiple times
                     navigational_callbacks = [
@@ -800,7 +794,7 @@ def run_telegram_bot():
                             # Handle wallet connect callbacks
                             if callback_data.startswith("wallet_connect_"):
                                 try:
-                                    amount = float(callback_data.split("_")[2])
+                                    amount = float(callback_data.split("_", 3)[2])
 
                                     # Send wallet connect prompt message
                                     send_response(
@@ -1108,44 +1102,8 @@ def run_telegram_bot():
                                 account_action = callback_data.replace("account_", "")
                                 
                                 if account_action == "wallet":
-                                    # Use our universal fix for all button issues
-                                    try:
-                                        # Import our universal direct button fix module
-                                        import direct_button_fix
-                                        
-                                        # Get user ID
-                                        user_id = update_obj.callback_query.from_user.id
-                                        
-                                        # Use the universal handler for wallet button
-                                        result = direct_button_fix.handle_button("account_wallet", user_id)
-                                        
-                                        if result and result.get("success", False):
-                                            # Send the response with custom reply markup
-                                            send_response(
-                                                chat_id,
-                                                result["message"],
-                                                parse_mode="Markdown",
-                                                reply_markup=result.get("keyboard", {})
-                                            )
-                                            
-                                            # Acknowledge the callback
-                                            update_obj.callback_query.answer("Wallet connection options ready")
-                                            
-                                            # Log success
-                                            logger.info("✅ Wallet button handler succeeded using direct_button_fix")
-                                            
-                                            # Return to skip further processing
-                                            return
-                                        else:
-                                            # Log error
-                                            error_msg = result.get("message", "Unknown error") if result else "Handler returned no result"
-                                            logger.error(f"❌ Wallet button handler failed: {error_msg}")
-                                    except Exception as e:
-                                        logger.error(f"Error in wallet button direct handler: {e}")
-                                        logger.error(traceback.format_exc())
-                                    
-                                    # Fallback: Redirect to walletconnect handler
-                                    logger.info("Falling back to walletconnect handler")
+                                    # Wallet options are served by the walletconnect handler below
+                                    logger.info("Redirecting account_wallet to walletconnect handler")
                                     callback_data = "walletconnect"
                                     # Continue to the walletconnect handler below
                                 
@@ -1487,9 +1445,8 @@ Share your experiences and learn from others!
                             # Handle simulate_period callbacks
                             elif callback_data.startswith("simulate_period_"):
                                 try:
-                                    parts = callback_data.split("_")
-                                    period = parts[2]  # daily, weekly, monthly, yearly
-                                    amount = float(parts[3]) if len(parts) > 3 else 1000.0
+                                    period, _, rest = callback_data[len("simulate_period_"):].partition("_")  # daily, weekly, monthly, yearly
+                                    amount = float(rest.partition("_")[0]) if rest else 1000.0
 
                                     # Get predefined pool data
                                     from response_data import get_pool_data as get_predefined_pool_data
@@ -2316,7 +2273,7 @@ Share your experiences and learn from others!
                     
                     # Create multiple tracking IDs for this message
                     msg_track_id = f"msg_{message_id}"
-                    msg_content_id = f"msg_content_{chat_id}_{hashlib.md5(message_text.encode()).hexdigest()[:8]}"
+                    msg_content_id = f"msg_content_{chat_id}_{hashlib.blake2b(message_text.encode(), digest_size=4).hexdigest()}"
                     
                     # Check if we've already processed this message using any tracking method
                     # Special handling for menu items to allow them to be pressed multiple times
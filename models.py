@@ -6,7 +6,8 @@ Database models for the Telegram cryptocurrency pool bot
 """
 
 import datetime
-from sqlalchemy import Column, Integer, BigInteger, String, Float, Boolean, DateTime, Text, ForeignKey, JSON, Enum
+from sqlalchemy import Column, Integer, BigInteger, String, Float, Boolean, DateTime, Text, ForeignKey, JSON, Enum, Index
+from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.orm import relationship
 from flask_sqlalchemy import SQLAlchemy
 from flask import Flask
@@ -240,8 +241,8 @@ class SuspiciousURL(db.Model):
     def __repr__(self):
         return f"<SuspiciousURL id={self.id}, url={self.url}, category={self.category}>"
 
-# Enum for position status
-class PositionStatus(enum.Enum):
+# Enum for position status; a str subclass, so members compare equal to their stored values
+class PositionStatus(str, enum.Enum):
     PENDING = "pending"       # Transaction created but not confirmed
     ACTIVE = "active"         # Position is actively providing liquidity
     MONITORED = "monitored"   # Position is being monitored for exit conditions
@@ -255,6 +256,10 @@ class CompositeSignal(db.Model):
     for a particular pool.
     """
     __tablename__ = "composite_signals"
+    __table_args__ = (
+        # Serves the "latest signal for a pool" lookups in the execution agent
+        Index("ix_composite_signal_pool_ts_desc", "pool_id", db.desc("timestamp")),
+    )
     
     id = Column(Integer, primary_key=True)
     timestamp = Column(DateTime, default=datetime.datetime.utcnow)
@@ -281,7 +286,11 @@ class Position(db.Model):
     id = Column(Integer, primary_key=True)
     user_id = Column(BigInteger, ForeignKey("users.id"), nullable=False)
     pool_id = Column(String(255), ForeignKey("pools.id"), nullable=False)
-    status = Column(String(20), default=PositionStatus.PENDING.value)
+    status = Column(
+        Enum(PositionStatus, native_enum=False, length=20,
+             values_callable=lambda statuses: [status.value for status in statuses]),
+        default=PositionStatus.PENDING
+    )
     
     # Investment details
     invested_amount_usd = Column(Float, nullable=False)  # Total USD value invested
@@ -310,7 +319,7 @@ class Position(db.Model):
     # Additional data
     initial_composite_signal_id = Column(Integer, ForeignKey("composite_signals.id"), nullable=True)
     exit_composite_signal_id = Column(Integer, ForeignKey("composite_signals.id"), nullable=True)
-    position_metadata = Column(JSON, nullable=True)  # Additional metadata
+    position_metadata = Column(MutableDict.as_mutable(JSON), nullable=True)  # Additional metadata, changes tracked in place
     
     # Relationships
     user = relationship("User")
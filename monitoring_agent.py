@@ -172,7 +172,7 @@ class MonitoringAgent:
         try:
             # Get all active positions
             active_positions = db.session.query(Position).filter(
-                Position.status.in_([PositionStatus.ACTIVE.value, PositionStatus.MONITORED.value])
+                Position.status.in_([PositionStatus.ACTIVE, PositionStatus.MONITORED])
             ).all()
             
             if not active_positions:
@@ -200,8 +200,8 @@ class MonitoringAgent:
                 
                 if exit_recommended:
                     # Update position status to monitored if not already
-                    if position.status != PositionStatus.MONITORED.value:
-                        position.status = PositionStatus.MONITORED.value
+                    if position.status != PositionStatus.MONITORED:
+                        position.status = PositionStatus.MONITORED
                         position.updated_at = datetime.now()
                         db.session.commit()
                     
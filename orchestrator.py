@@ -15,7 +15,7 @@ import json
 
 # Import local modules
 from models import User, Pool, Position, CompositeSignal, PositionStatus, db
-from recommendation_agent import RecommendationAgent
+from recommendation_agent import RecommendationAgent, VALID_PROFILES
 from execution_agent import ExecutionAgent
 from monitoring_agent import MonitoringAgent
 from walletconnect_utils import create_walletconnect_session, check_walletconnect_session
@@ -57,7 +57,7 @@ class Orchestrator:
         
         try:
             # Validate profile
-            if profile not in ["high-risk", "stable"]:
+            if profile not in VALID_PROFILES:
                 return {
                     "success": False,
                     "error": "Invalid profile. Choose 'high-risk' or 'stable'."
@@ -0,0 +1,164 @@
+"""
+Shared SQLite access for the direct profile handlers.
+All risk-profile writes go through write_profile, which owns the connection,
+the prepared upsert and the write queue.
+"""
+
+import logging
+import sqlite3
+import threading
+from collections import deque
+from typing import Deque, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Database file
+DB_FILE = "filot_bot.db"
+
+# Connection tuning applied once when the shared connection is opened
+_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-64000;
+PRAGMA busy_timeout=5000;
+"""
+
+# Users table, created once when the shared connection is opened.
+# Kept as a rowid table: "id INTEGER PRIMARY KEY" already aliases the rowid, so
+# lookups by id are a single b-tree search, and WITHOUT ROWID would only pack
+# these wide TEXT rows into the key b-tree without saving any page reads.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY,
+    username TEXT,
+    first_name TEXT,
+    last_name TEXT,
+    risk_profile TEXT DEFAULT 'stable',
+    investment_horizon TEXT DEFAULT 'medium',
+    subscribed BOOLEAN DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    last_active TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    wallet_address TEXT,
+    verification_code TEXT,
+    verified BOOLEAN DEFAULT 0
+);
+"""
+
+# Profile upsert, kept as one string so the connection's statement cache reuses it.
+# The WHERE clause leaves the row untouched when the stored profile already
+# matches; other modules also write risk_profile, so the database decides.
+_UPSERT_SQL = (
+    "INSERT INTO users (id, risk_profile, username) VALUES (?, ?, ?) "
+    "ON CONFLICT(id) DO UPDATE SET risk_profile = excluded.risk_profile "
+    "WHERE risk_profile IS NOT excluded.risk_profile"
+)
+
+_conn_lock = threading.Lock()
+_connection: Optional[sqlite3.Connection] = None
+
+def _ensure_schema(conn: sqlite3.Connection) -> None:
+    """
+    Create the users table if it doesn't exist yet.
+    
+    Args:
+        conn: The open database connection
+    """
+    conn.executescript(_SCHEMA)
+
+def _get_conn() -> sqlite3.Connection:
+    """
+    Get the shared SQLite connection, opening, tuning and initializing
+    the schema on first use.
+    
+    The connection runs in autocommit mode, so each statement commits on its own.
+    
+    Returns:
+        The open connection
+    """
+    global _connection
+    if _connection is None:
+        with _conn_lock:
+            if _connection is None:
+                conn = sqlite3.connect(
+                    DB_FILE,
+                    check_same_thread=False,
+                    isolation_level=None,
+                    cached_statements=256
+                )
+                conn.executescript(_PRAGMAS)
+                _ensure_schema(conn)
+                _connection = conn
+    return _connection
+
+class _PendingWrite:
+    """A queued profile upsert and the outcome of the transaction that flushed it."""
+    
+    __slots__ = ("row", "ok")
+    
+    def __init__(self, row: Tuple[int, str, str]):
+        self.row = row
+        # None until a flush commits (True) or rolls back (False) this write
+        self.ok: Optional[bool] = None
+
+# Profile writes waiting to be committed; see write_profile
+_pending: Deque[_PendingWrite] = deque()
+_write_lock = threading.Lock()
+
+def _flush_pending() -> None:
+    """
+    Commit every queued write in one transaction and record each write's outcome.
+    
+    Must be called with _write_lock held. If any statement, including the
+    COMMIT, fails, the transaction is rolled back and every write in the
+    batch is marked as failed.
+    """
+    batch = []
+    while _pending:
+        batch.append(_pending.popleft())
+    
+    ok = False
+    try:
+        conn = _get_conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(_UPSERT_SQL, [write.row for write in batch])
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        ok = True
+    except Exception as e:
+        logger.error("Error committing %d profile write(s): %s", len(batch), e)
+    finally:
+        for write in batch:
+            write.ok = ok
+
+def write_profile(user_id: int, profile_type: str) -> bool:
+    """
+    Save a user's risk profile, creating the user if needed.
+    
+    The upsert is queued and whichever caller takes the write lock first flushes
+    the whole queue in one transaction, so concurrent clicks share a single
+    commit. A caller whose write was already flushed by another thread returns
+    that flush's outcome without touching the database. Writing the profile a
+    user already has leaves their row unchanged.
+    
+    Args:
+        user_id: The user's ID
+        profile_type: Either 'high-risk' or 'stable'
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    write = _PendingWrite((user_id, profile_type, f"user_{user_id}"))
+    _pending.append(write)
+    with _write_lock:
+        # Another caller's flush may already have taken this write
+        if write.ok is None:
+            _flush_pending()
+    
+    if not write.ok:
+        logger.error("Error saving %s profile for user %s", profile_type, user_id)
+    return write.ok
@@ -0,0 +1,34 @@
+"""
+Profile confirmation messages shared by the direct profile handlers.
+"""
+
+HIGH_RISK_MESSAGE = """
+🔴 *High-Risk Profile Selected*
+
+Your investment recommendations will now focus on:
+• Higher APR opportunities
+• Newer pools with growth potential
+• More volatile but potentially rewarding options
+
+_Note: Higher returns come with increased risk_
+"""
+
+STABLE_MESSAGE = """
+🟢 *Stable Profile Selected*
+
+Your investment recommendations will now focus on:
+• Established, reliable pools
+• Lower volatility options
+• More consistent but potentially lower APR
+
+_Note: Stability typically means more moderate returns_
+"""
+
+# Message for each profile type
+PROFILE_MESSAGES = {
+    "high-risk": HIGH_RISK_MESSAGE,
+    "stable": STABLE_MESSAGE,
+}
+
+# Profile types accepted by the profile handlers
+VALID_PROFILES = frozenset(PROFILE_MESSAGES)
@@ -27,6 +27,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Risk profiles the agent can recommend for
+VALID_PROFILES = frozenset({"high-risk", "stable"})
+
 class RecommendationAgent:
     """Agent responsible for generating intelligent pool recommendations"""
     
@@ -291,7 +294,7 @@ class RecommendationAgent:
         
         try:
             # Validate profile
-            if profile not in ["high-risk", "stable"]:
+            if profile not in VALID_PROFILES:
                 return {
                     "success": False,
                     "error": "Invalid profile. Choose 'high-risk' or 'stable'."
@@ -301,10 +301,12 @@ def create_predefined_pools():
     
     # Get current prices for key tokens if possible
     try:
+        # One request for both tokens instead of two rate-limited calls
+        live_prices = coingecko_utils.get_multiple_token_prices(["SOL", "RAY"])
         token_prices = {
-            "SOL": coingecko_utils.get_token_price("SOL"),
+            "SOL": live_prices["SOL"],
             "USDC": 1.0,  # Stablecoin
-            "RAY": coingecko_utils.get_token_price("RAY"),
+            "RAY": live_prices["RAY"],
             "USDT": 1.0,  # Stablecoin
         }
     except Exception:
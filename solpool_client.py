@@ -14,7 +14,8 @@ import asyncio
 from typing import Dict, List, Any, Optional
 
 import aiohttp
-from functools import lru_cache
+
+from async_cache import async_ttl_cache
 
 # Import mock data functions for fallback when API is unavailable
 from api_mock_data import (
@@ -32,6 +33,16 @@ logger = logging.getLogger('solpool_client')
 # Flag to control when to use mock data
 USE_MOCK_DATA = os.environ.get("USE_MOCK_DATA", "true").lower() in ("true", "1", "yes")
 
+# How long successful responses are reused, in seconds
+POOLS_CACHE_TTL = 300           # 5 minutes
+POOL_DETAIL_CACHE_TTL = 300     # 5 minutes
+POOL_HISTORY_CACHE_TTL = 3600   # 1 hour
+PREDICTIONS_CACHE_TTL = 1800    # 30 minutes
+
+def _is_cacheable(response: Dict[str, Any]) -> bool:
+    """Only keep successful responses; errors should be retried on the next call."""
+    return "error" not in response
+
 # Singleton instance
 _instance = None
 
@@ -59,10 +70,10 @@ class SolPoolClient:
 
         # Cache TTLs (in seconds)
         self.cache_ttl = {
-            "pools": 300,           # 5 minutes
-            "pool_detail": 300,     # 5 minutes
-            "pool_history": 3600,   # 1 hour
-            "predictions": 1800,    # 30 minutes
+            "pools": POOLS_CACHE_TTL,
+            "pool_detail": POOL_DETAIL_CACHE_TTL,
+            "pool_history": POOL_HISTORY_CACHE_TTL,
+            "predictions": PREDICTIONS_CACHE_TTL,
             "forecast": 1800        # 30 minutes
         }
         
@@ -212,8 +223,8 @@ class SolPoolClient:
         return {"error": "Maximum retries exceeded"}
 
     # Cache decorated function for pools by DEX with min prediction score
-    @lru_cache(maxsize=16)
-    async def _fetch_pools_cached(self, dex: str, min_tvl: float, min_apr: float, min_prediction: float, timestamp: int) -> Dict[str, Any]:
+    @async_ttl_cache(ttl=POOLS_CACHE_TTL, maxsize=16, cache_if=_is_cacheable)
+    async def _fetch_pools_cached(self, dex: str, min_tvl: float, min_apr: float, min_prediction: float) -> Dict[str, Any]:
         """Cached version of fetch_pools to minimize API calls."""
         params = {}
         
@@ -255,10 +266,7 @@ class SolPoolClient:
             logger.info("Using mock data for fetch_pools")
             return get_mock_pools(dex, min_tvl, min_apr, min_prediction)
         
-        # Round to nearest 5 minutes to improve cache hits
-        timestamp = int(time.time()) // 300
-        
-        response = await self._fetch_pools_cached(dex, min_tvl, min_apr, min_prediction, timestamp)
+        response = await self._fetch_pools_cached(dex, min_tvl, min_apr, min_prediction)
         
         if "error" in response:
             logger.error(f"Error fetching pools: {response['error']}")
@@ -280,8 +288,8 @@ class SolPoolClient:
             return get_mock_pools(dex, min_tvl, min_apr, min_prediction)
 
     # Cache decorated function for pool detail by id
-    @lru_cache(maxsize=32)
-    async def _fetch_pool_detail_cached(self, pool_id: str, timestamp: int) -> Dict[str, Any]:
+    @async_ttl_cache(ttl=POOL_DETAIL_CACHE_TTL, maxsize=32, cache_if=_is_cacheable)
+    async def _fetch_pool_detail_cached(self, pool_id: str) -> Dict[str, Any]:
         """Cached version of fetch_pool_detail to minimize API calls."""
         return await self._make_request(f"/pools/{pool_id}")
 
@@ -300,10 +308,7 @@ class SolPoolClient:
             logger.info("Using mock data for fetch_pool_detail")
             return get_mock_pool_detail(pool_id)
         
-        # Round to nearest 5 minutes to improve cache hits
-        timestamp = int(time.time()) // 300
-        
-        response = await self._fetch_pool_detail_cached(pool_id, timestamp)
+        response = await self._fetch_pool_detail_cached(pool_id)
         
         if "error" in response:
             logger.error(f"Error fetching pool detail: {response['error']}")
@@ -323,8 +328,8 @@ class SolPoolClient:
             return get_mock_pool_detail(pool_id)
 
     # Cache decorated function for pool history
-    @lru_cache(maxsize=16)
-    async def _fetch_pool_history_cached(self, pool_id: str, days: int, interval: str, timestamp: int) -> Dict[str, Any]:
+    @async_ttl_cache(ttl=POOL_HISTORY_CACHE_TTL, maxsize=16, cache_if=_is_cacheable)
+    async def _fetch_pool_history_cached(self, pool_id: str, days: int, interval: str) -> Dict[str, Any]:
         """Cached version of fetch_pool_history to minimize API calls."""
         params = {
             "days": days,
@@ -357,10 +362,7 @@ class SolPoolClient:
         # Limit days to a reasonable range
         days = max(1, min(days, 90))
         
-        # Round to nearest hour to improve cache hits
-        timestamp = int(time.time()) // 3600
-        
-        response = await self._fetch_pool_history_cached(pool_id, days, interval, timestamp)
+        response = await self._fetch_pool_history_cached(pool_id, days, interval)
         
         if "error" in response:
             logger.error(f"Error fetching pool history: {response['error']}")
@@ -382,8 +384,8 @@ class SolPoolClient:
             return get_mock_pool_history(pool_id, days, interval)
 
     # Cache decorated function for predictions with min score
-    @lru_cache(maxsize=8)
-    async def _fetch_predictions_cached(self, min_score: float, timestamp: int) -> Dict[str, Any]:
+    @async_ttl_cache(ttl=PREDICTIONS_CACHE_TTL, maxsize=8, cache_if=_is_cacheable)
+    async def _fetch_predictions_cached(self, min_score: float) -> Dict[str, Any]:
         """Cached version of fetch_predictions to minimize API calls."""
         params = {}
         
@@ -407,10 +409,7 @@ class SolPoolClient:
             logger.info("Using mock data for fetch_predictions")
             return get_mock_predictions(min_score)
         
-        # Round to nearest 30 minutes to improve cache hits
-        timestamp = int(time.time()) // 1800
-        
-        response = await self._fetch_predictions_cached(min_score, timestamp)
+        response = await self._fetch_predictions_cached(min_score)
         
         if "error" in response:
             logger.error(f"Error fetching predictions: {response['error']}")